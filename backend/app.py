@@ -13,6 +13,12 @@ from config import get_config, validate_config
 from utils import init_connection_pool, generate_request_id
 from middleware import register_error_handlers, init_redis
 from routes import auth_bp, health_bp, webhooks_bp
+from services import (
+    begin_request_auth_cache,
+    end_request_auth_cache,
+    ensure_session_partitions,
+    seed_webhook_filter,
+)
 
 # Configure structured logging
 structlog.configure(
@@ -28,6 +34,9 @@ structlog.configure(
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
+    # WHY cache: Module-level get_logger() returns a lazy proxy that
+    # otherwise rebuilds the bound logger on every log call
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger(__name__)
@@ -66,6 +75,12 @@ def create_app() -> Flask:
         if config.is_production:
             sys.exit(1)
     
+    # Keep monthly session partitions ahead of inserts (migration 009)
+    try:
+        ensure_session_partitions()
+    except Exception as e:
+        logger.error("Failed to ensure session partitions", error=str(e))
+    
     # Initialize Redis
     try:
         init_redis()
@@ -73,6 +88,13 @@ def create_app() -> Flask:
     except Exception as e:
         logger.warning("Failed to initialize Redis", error=str(e))
     
+    # Build the webhook dedupe filter if Redis has none (deploy or flush);
+    # a scheduled call covers flushes between deploys
+    try:
+        seed_webhook_filter(if_missing=True)
+    except Exception as e:
+        logger.warning("Failed to seed webhook filter", error=str(e))
+    
     # Register error handlers (Invariant #9)
     register_error_handlers(app)
     
@@ -81,6 +103,14 @@ def create_app() -> Flask:
     def before_request():
         """Set up request context."""
         g.request_id = generate_request_id()
+        g.auth_cache_token = begin_request_auth_cache()
+    
+    @app.teardown_request
+    def teardown_request(exc):
+        """Drop request-scoped authorization lookups."""
+        token = g.pop('auth_cache_token', None)
+        if token is not None:
+            end_request_auth_cache(token)
     
     @app.after_request
     def after_request(response):
@@ -35,6 +35,11 @@ class DatabaseConfig:
     
     # WHY SSL required: Network is hostile (PRD §3)
     ssl_required: bool = True
+    
+    # WHY flag: Set when DATABASE_URL points at PgBouncer in transaction
+    # mode. Server connections change between transactions, so no
+    # session state (prepared statements, SET) may be relied on.
+    pgbouncer: bool = field(default_factory=lambda: os.environ.get('DATABASE_PGBOUNCER', 'false').lower() == 'true')
 
 
 @dataclass(frozen=True)
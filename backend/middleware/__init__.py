@@ -13,6 +13,7 @@ from middleware.auth import (
 
 from middleware.rate_limit import (
     init_redis,
+    get_redis,
     rate_limit,
     rate_limit_login,
     rate_limit_payment,
@@ -35,6 +36,7 @@ __all__ = [
     'extract_token',
     # Rate limiting
     'init_redis',
+    'get_redis',
     'rate_limit',
     'rate_limit_login',
     'rate_limit_payment',
@@ -10,6 +10,8 @@ from services.session import (
     revoke_session,
     revoke_all_user_sessions,
     revoke_sessions_by_team,
+    ensure_session_partitions,
+    cleanup_expired_sessions,
     RevocationReason,
     Session,
 )
@@ -26,6 +28,8 @@ from services.authorization import (
     TeamMembership,
     get_authorization_context,
     require_team_access,
+    begin_request_auth_cache,
+    end_request_auth_cache,
     get_user_teams,
     add_team_member,
     change_member_role,
@@ -60,6 +64,8 @@ from services.audit import (
     log_event,
     log_auth_attempt,
     log_security_event,
+    verify_log_integrity,
+    find_tampered_logs,
 )
 
 from services.circuit_breaker import (
@@ -84,6 +90,7 @@ from services.webhooks import (
     check_webhook_processed,
     record_webhook,
     process_stripe_webhook,
+    seed_webhook_filter,
     WebhookError,
     WebhookSignatureError,
     WebhookDuplicateError,
@@ -7,12 +7,12 @@ Invariant #10: All critical actions are attributable to an actor.
 """
 
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from enum import Enum
 import json
 import structlog
 
-from utils import get_cursor, sign_audit_entry, verify_audit_entry, DatabaseError
+from utils import get_cursor, sign_audit_entry, verify_audit_entry, verify_audit_entries, DatabaseError
 from services.transactions import audit_transaction
 from config import get_config
 
@@ -57,9 +57,22 @@ def log_event(
     details: Optional[Dict[str, Any]] = None,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
-    request_id: Optional[str] = None
-) -> str:
-    """Log an audit event with HMAC signing."""
+    request_id: Optional[str] = None,
+    cursor: Optional[Any] = None
+) -> Optional[str]:
+    """
+    Log an audit event with HMAC signing.
+    
+    WHY optional cursor: By default the entry commits in its own
+    transaction. Passing a cursor on the caller's connection queues the
+    INSERT in the caller's transaction instead, so it commits or rolls
+    back with the change it records and can share a pipeline with it.
+    Nothing is fetched in that mode: an audit failure surfaces at the
+    caller's next fetch or commit and aborts its transaction.
+    
+    Returns:
+        Audit log ID, or None when written through a caller's cursor
+    """
     config = get_config()
     now = datetime.now(timezone.utc)
     
@@ -84,14 +97,19 @@ def log_event(
         RETURNING id
     """
     
+    params = (
+        event_type.value, actor_id, actor_type.value,
+        resource_type, resource_id, action,
+        json.dumps(details) if details else None,
+        ip_address, user_agent, request_id, signature
+    )
+    
     try:
+        if cursor is not None:
+            cursor.execute(query, params)
+            return None
         with audit_transaction() as cur:
-            cur.execute(query, (
-                event_type.value, actor_id, actor_type.value,
-                resource_type, resource_id, action,
-                json.dumps(details) if details else None,
-                ip_address, user_agent, request_id, signature
-            ))
+            cur.execute(query, params)
             return str(cur.fetchone()['id'])
     except Exception as e:
         logger.critical("AUDIT LOG FAILED", event_type=event_type.value, error=str(e))
@@ -132,6 +150,16 @@ def log_security_event(
     )
 
 
+def _signed_entry_data(row: dict) -> Dict[str, Any]:
+    """Rebuild the dict log_event signed from a stored audit_logs row."""
+    return {
+        'event_type': row['event_type'], 'actor_id': row['actor_id'],
+        'actor_type': row['actor_type'], 'resource_type': row['resource_type'],
+        'resource_id': row['resource_id'], 'action': row['action'],
+        'details': row['details'], 'created_at': row['created_at'].isoformat()
+    }
+
+
 def verify_log_integrity(log_id: int) -> bool:
     """Verify audit log entry has not been tampered with."""
     config = get_config()
@@ -146,13 +174,61 @@ def verify_log_integrity(log_id: int) -> bool:
             row = cur.fetchone()
             if not row:
                 return False
-            entry_data = {
-                'event_type': row['event_type'], 'actor_id': row['actor_id'],
-                'actor_type': row['actor_type'], 'resource_type': row['resource_type'],
-                'resource_id': row['resource_id'], 'action': row['action'],
-                'details': row['details'], 'created_at': row['created_at'].isoformat()
-            }
-            return verify_audit_entry(entry_data, row['hmac_signature'], config.audit.hmac_secret)
+            return verify_audit_entry(_signed_entry_data(row), row['hmac_signature'], config.audit.hmac_secret)
     except Exception as e:
         logger.error("Integrity check failed", log_id=log_id, error=str(e))
         return False
+
+
+def find_tampered_logs(after_id: int = 0, batch_size: int = 1000) -> List[int]:
+    """
+    Verify every audit log entry after after_id; return the IDs that fail.
+    
+    Integrity sweep for incident response (Invariant #5).
+    
+    WHY keyset batches: Each batch is one short autocommit read by
+    primary key, so a sweep over the whole table never holds a
+    transaction open.
+    WHY verify_audit_entries: HMAC setup is done once per batch instead
+    of once per entry.
+    
+    Args:
+        after_id: Start after this audit log ID (0 for the whole table)
+        batch_size: Entries read and verified per round-trip
+        
+    Returns:
+        IDs of entries whose signature does not match
+    """
+    secret = get_config().audit.hmac_secret
+    query = """
+        SELECT id, event_type, actor_id, actor_type, resource_type, resource_id,
+               action, details, created_at, hmac_signature
+        FROM audit_logs WHERE id > %s
+        ORDER BY id LIMIT %s
+    """
+    
+    tampered = []
+    checked = 0
+    try:
+        while True:
+            with get_cursor(autocommit=True) as cur:
+                cur.execute(query, (after_id, batch_size))
+                rows = cur.fetchall()
+            if not rows:
+                break
+            
+            results = verify_audit_entries(
+                ((_signed_entry_data(row), row['hmac_signature']) for row in rows),
+                secret
+            )
+            tampered.extend(row['id'] for row, ok in zip(rows, results) if not ok)
+            checked += len(rows)
+            after_id = rows[-1]['id']
+    except Exception as e:
+        logger.error("Integrity sweep failed", after_id=after_id, error=str(e))
+        raise DatabaseError(f"Integrity sweep failed: {e}")
+    
+    if tampered:
+        logger.critical("Audit log entries failed verification", count=len(tampered), ids=tampered[:100])
+    logger.info("Audit integrity sweep complete", checked=checked, tampered=len(tampered))
+    return tampered
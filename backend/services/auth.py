@@ -317,7 +317,11 @@ class AuthService:
                 from services.session import get_session_by_token, revoke_session
                 session = get_session_by_token(access_token)
                 if session:
-                    revoke_session(session.id, RevocationReason.MANUAL_LOGOUT)
+                    revoke_session(
+                        session.id,
+                        RevocationReason.MANUAL_LOGOUT,
+                        created_at=session.created_at
+                    )
                 logger.info("User logged out", user_id=user_id)
             
             return True
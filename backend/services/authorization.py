@@ -7,8 +7,12 @@ Invariant #6: Backend authorization overrides frontend state.
 
 WHY query-time checks: No permission caching. Roles could change
 between requests, cache would allow unauthorized access.
+WHY per-request memo: Within one request the decorator and each service
+call re-check the same (user, team). Lookups are memoized for the
+lifetime of that request only and discarded at teardown.
 """
 
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone
 from typing import Optional, List
 from dataclasses import dataclass
@@ -24,6 +28,11 @@ from services.session import (
 
 logger = structlog.get_logger(__name__)
 
+# Request-scoped memo of authorization lookups; None outside a request
+_request_auth_cache: ContextVar[Optional[dict]] = ContextVar(
+    '_request_auth_cache', default=None
+)
+
 
 class Role(Enum):
     """Team roles in descending privilege order."""
@@ -100,6 +109,28 @@ class RoleError(AuthorizationError):
     pass
 
 
+def begin_request_auth_cache() -> Token:
+    """
+    Start a request-scoped authorization memo.
+    
+    Returns:
+        Token to pass to end_request_auth_cache
+    """
+    return _request_auth_cache.set({})
+
+
+def end_request_auth_cache(token: Token) -> None:
+    """Discard the request-scoped authorization memo."""
+    _request_auth_cache.reset(token)
+
+
+def _invalidate_request_auth(user_id: str, team_id: str) -> None:
+    """Drop a memoized lookup after a membership change in this request."""
+    cache = _request_auth_cache.get()
+    if cache is not None:
+        cache.pop((user_id, team_id), None)
+
+
 def get_authorization_context(
     user_id: str,
     team_id: str
@@ -108,6 +139,7 @@ def get_authorization_context(
     Get authorization context for user in team.
     
     WHY query time: No caching. Fresh from DB every request (Invariant #3).
+    Repeat lookups inside the same request reuse the first result.
     
     Args:
         user_id: User UUID
@@ -125,8 +157,12 @@ def get_authorization_context(
         AND t.deleted_at IS NULL
     """
     
+    cache = _request_auth_cache.get()
+    if cache is not None and (user_id, team_id) in cache:
+        return cache[(user_id, team_id)]
+    
     try:
-        with get_cursor() as cur:
+        with get_cursor(autocommit=True) as cur:
             cur.execute(query, (user_id, team_id))
             row = cur.fetchone()
             
@@ -136,14 +172,18 @@ def get_authorization_context(
                     user_id=user_id,
                     team_id=team_id
                 )
-                return None
+                context = None
+            else:
+                context = AuthorizationContext(
+                    user_id=row['user_id'],
+                    team_id=row['team_id'],
+                    role=Role(row['role']),
+                    is_active=row['is_active']
+                )
             
-            return AuthorizationContext(
-                user_id=row['user_id'],
-                team_id=row['team_id'],
-                role=Role(row['role']),
-                is_active=row['is_active']
-            )
+            if cache is not None:
+                cache[(user_id, team_id)] = context
+            return context
     except DatabaseError:
         raise
     except Exception as e:
@@ -283,6 +323,7 @@ def add_team_member(
         with get_cursor() as cur:
             cur.execute(query, (team_id, user_id, role.value, invited_by, now, now))
             row = cur.fetchone()
+            _invalidate_request_auth(user_id, team_id)
             
             logger.info(
                 "Team member added",
@@ -351,6 +392,8 @@ def change_member_role(
             if cur.rowcount == 0:
                 raise TeamBoundaryError(f"User {user_id} not in team {team_id}")
         
+        _invalidate_request_auth(user_id, team_id)
+        
         # CRITICAL: Revoke all sessions for affected user (Invariant #4)
         revoke_all_user_sessions(
             user_id=user_id,
@@ -406,6 +449,8 @@ def remove_team_member(
         with get_cursor() as cur:
             cur.execute(query, (now, team_id, user_id))
         
+        _invalidate_request_auth(user_id, team_id)
+        
         # Revoke sessions for removed user's team access
         revoke_all_user_sessions(
             user_id=user_id,
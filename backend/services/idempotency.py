@@ -19,6 +19,7 @@ from utils import (
     get_connection,
     get_cursor,
     generate_request_hash,
+    generate_legacy_request_hash,
     DatabaseError,
 )
 from config import get_config
@@ -115,7 +116,9 @@ def check_idempotency(
             response = row['response']
             
             # Check if hash matches
-            if stored_hash != request_hash:
+            # WHY legacy digest: Keys stored before the BLAKE3 switch hold
+            # SHA-256 and stay valid for up to 48 hours
+            if stored_hash != request_hash and stored_hash != generate_legacy_request_hash(request_body):
                 # WHY 409: Same key with different payload is suspicious
                 # Could be replay attack or buggy client
                 logger.warning(
@@ -205,6 +208,16 @@ def acquire_idempotency_lock(
             cur.execute(query, (key, user_id, request_hash, now, expires_at, now, request_hash))
             row = cur.fetchone()
             
+            if row is None:
+                # WHY legacy digest on a miss only: Keys stored before the
+                # BLAKE3 switch hold SHA-256. The second hash is paid only
+                # by retries of those keys, not by every request.
+                cur.execute(query, (
+                    key, user_id, request_hash, now, expires_at, now,
+                    generate_legacy_request_hash(request_body)
+                ))
+                row = cur.fetchone()
+            
             if row is None:
                 # ON CONFLICT but hash didn't match WHERE clause
                 raise IdempotencyConflict(
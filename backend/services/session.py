@@ -9,11 +9,12 @@ WHY session table separate from JWT: JWT validity does NOT imply
 session validity (PRD §6). We check both.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from typing import Optional
 from dataclasses import dataclass
 from enum import Enum
 import structlog
+from psycopg import sql, errors
 
 from utils import (
     get_cursor,
@@ -24,6 +25,14 @@ from config import get_config
 
 logger = structlog.get_logger(__name__)
 
+# WHY 3: The current month and three ahead exist after every startup or
+# maintenance run, so inserts keep working through months of missed runs
+SESSION_PARTITION_MONTHS_AHEAD = 3
+
+# WHY a lock_timeout for retirement: Give up on a busy partition and
+# retry next run rather than queue behind long transactions
+PARTITION_LOCK_TIMEOUT_MS = 2000
+
 
 class RevocationReason(Enum):
     """Reasons for session revocation per PRD §6."""
@@ -90,14 +99,25 @@ def create_session(
         RETURNING id, user_id, token_hash, team_id, ip_address, user_agent, created_at, last_used_at, revoked_at, revocation_reason
     """
     
+    params = (user_id, token_hash, team_id, ip_address, user_agent, now, now)
+    
     try:
-        with get_cursor() as cur:
-            cur.execute(query, (user_id, token_hash, team_id, ip_address, user_agent, now, now))
-            row = cur.fetchone()
-            
-            logger.info("Session created", user_id=user_id, session_id=row['id'])
-            
-            return Session(**row)
+        try:
+            with get_cursor() as cur:
+                cur.execute(query, params)
+                row = cur.fetchone()
+        except errors.CheckViolation:
+            # WHY retry once: No partition covers created_at (sessions has
+            # no default partition). Create it rather than fail the login.
+            logger.warning("Session partition missing, creating", month=now.strftime('%Y-%m'))
+            ensure_session_partitions()
+            with get_cursor() as cur:
+                cur.execute(query, params)
+                row = cur.fetchone()
+        
+        logger.info("Session created", user_id=user_id, session_id=row['id'])
+        
+        return Session(**row)
     except DatabaseError:
         raise
     except Exception as e:
@@ -110,6 +130,9 @@ def get_session_by_token(jwt_token: str) -> Optional[Session]:
     Look up session by JWT token.
     
     WHY check revoked_at: Invariant #1 - must reject revoked sessions.
+    WHY no coalescing of concurrent lookups: A request that starts after
+    revoke_session commits must not reuse a lookup whose snapshot
+    predates the revoke. Every request reads the row itself.
     
     Args:
         jwt_token: Raw JWT access token
@@ -174,22 +197,27 @@ def validate_session(jwt_token: str) -> tuple[bool, Optional[Session], Optional[
         return (False, session, f"Session revoked: {session.revocation_reason}")
     
     # Update last_used_at for session activity tracking
-    _update_session_activity(session.id)
+    _update_session_activity(session.id, session.created_at)
     
     return (True, session, None)
 
 
-def _update_session_activity(session_id: str) -> None:
-    """Update last_used_at timestamp for session."""
+def _update_session_activity(session_id: str, created_at: datetime) -> None:
+    """
+    Update last_used_at timestamp for session.
+    
+    WHY created_at: It is the partition key, so the planner prunes to one
+    monthly partition instead of probing the id index of every month.
+    """
     query = """
         UPDATE sessions
         SET last_used_at = %s
-        WHERE id = %s
+        WHERE id = %s AND created_at = %s
     """
     
     try:
         with get_cursor() as cur:
-            cur.execute(query, (datetime.now(timezone.utc), session_id))
+            cur.execute(query, (datetime.now(timezone.utc), session_id, created_at))
     except Exception as e:
         # WHY not raise: Activity tracking failure should not break request
         logger.warning("Failed to update session activity", session_id=session_id, error=str(e))
@@ -198,7 +226,8 @@ def _update_session_activity(session_id: str) -> None:
 def revoke_session(
     session_id: str,
     reason: RevocationReason,
-    actor_id: Optional[str] = None
+    actor_id: Optional[str] = None,
+    created_at: Optional[datetime] = None
 ) -> bool:
     """
     Revoke a specific session.
@@ -207,21 +236,30 @@ def revoke_session(
         session_id: Session UUID
         reason: Revocation reason
         actor_id: Who initiated revocation (for audit)
+        created_at: Session creation time; when known, limits the update
+            to that session's monthly partition
         
     Returns:
         True if session was revoked
     """
-    query = """
-        UPDATE sessions
-        SET revoked_at = %s, revocation_reason = %s
-        WHERE id = %s AND revoked_at IS NULL
-    """
-    
-    now = datetime.now(timezone.utc)
+    if created_at is not None:
+        query = """
+            UPDATE sessions
+            SET revoked_at = %s, revocation_reason = %s
+            WHERE id = %s AND created_at = %s AND revoked_at IS NULL
+        """
+        params = (datetime.now(timezone.utc), reason.value, session_id, created_at)
+    else:
+        query = """
+            UPDATE sessions
+            SET revoked_at = %s, revocation_reason = %s
+            WHERE id = %s AND revoked_at IS NULL
+        """
+        params = (datetime.now(timezone.utc), reason.value, session_id)
     
     try:
         with get_cursor() as cur:
-            cur.execute(query, (now, reason.value, session_id))
+            cur.execute(query, params)
             revoked = cur.rowcount > 0
             
             if revoked:
@@ -348,40 +386,119 @@ def revoke_sessions_by_team(
         raise DatabaseError(f"Failed to revoke sessions: {e}")
 
 
+def ensure_session_partitions(months_ahead: int = SESSION_PARTITION_MONTHS_AHEAD) -> None:
+    """
+    Create monthly session partitions for this month and months_ahead more.
+    
+    Called at application startup and by cleanup_expired_sessions.
+    Idempotent; each month commits on its own.
+    
+    WHY ahead of time: sessions has no default partition (migration 009),
+    so an insert for a month without a partition fails.
+    """
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    
+    try:
+        with get_cursor(autocommit=True) as cur:
+            for _ in range(months_ahead + 1):
+                cur.execute("SELECT ensure_sessions_partition(%s)", (month,))
+                month = (month + timedelta(days=32)).replace(day=1)
+    except Exception as e:
+        logger.error("Failed to ensure session partitions", error=str(e))
+        raise DatabaseError(f"Failed to ensure session partitions: {e}")
+
+
 def cleanup_expired_sessions(days_old: int = 30) -> int:
     """
-    Remove old revoked sessions for cleanup.
+    Drop monthly session partitions whose sessions all expired before the
+    retention window.
     
-    WHY keep revoked sessions: Audit trail for security investigation.
-    WHY cleanup: Prevent unbounded table growth.
+    A session row belongs to one access token (refresh creates a new row),
+    so it expires access_token_expire_minutes after created_at. The newest
+    row of a partition is created before the partition's upper bound, so
+    upper + that lifetime bounds every expiry in it. A partition is
+    dropped only once that bound is older than days_old.
+    
+    WHY keep revoked and expired sessions for days_old: Security
+    investigation needs them for a while; after that they go with their
+    month.
+    WHY DROP TABLE over DELETE: sessions is range-partitioned by month
+    (migration 009). Dropping a partition is a metadata operation with
+    no per-row WAL and no dead tuples left for VACUUM.
+    WHY DETACH ... CONCURRENTLY first: A plain DROP of a partition takes
+    an ACCESS EXCLUSIVE lock on sessions, so every session lookup queues
+    behind it. The concurrent detach only takes SHARE UPDATE EXCLUSIVE,
+    which session reads and writes do not conflict with. It cannot run
+    in a transaction block, hence autocommit, one partition at a time.
+    WHY lock_timeout via set_config(..., true): The DROP runs in its own
+    short transaction and the setting ends with it, so under PgBouncer
+    transaction pooling it never leaks to another client's connection.
+    
+    Also ensures partitions exist ahead of inserts.
     
     Args:
-        days_old: Delete revoked sessions older than this
+        days_old: Retention after the newest session in a month expired
         
     Returns:
-        Number of sessions deleted
+        Number of partitions dropped
     """
+    ensure_session_partitions()
+    
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_old)
+    lifetime = timedelta(minutes=get_config().auth.access_token_expire_minutes)
     
+    # WHY LEFT JOIN: A partition detached on an earlier run whose DROP
+    # failed is no longer in pg_inherits but must still be dropped
     query = """
-        DELETE FROM sessions
-        WHERE revoked_at IS NOT NULL AND revoked_at < %s
+        SELECT child.relname,
+               pg_inherits.inhdetachpending,
+               pg_inherits.inhrelid IS NOT NULL AS attached
+        FROM pg_class child
+        LEFT JOIN pg_inherits ON pg_inherits.inhrelid = child.oid
+        WHERE child.relkind = 'r'
+        AND child.relname ~ '^sessions_[0-9]{6}$'
+        AND pg_table_is_visible(child.oid)
     """
     
     try:
-        with get_cursor() as cur:
-            cur.execute(query, (cutoff,))
-            count = cur.rowcount
-            
-            logger.info("Expired sessions cleaned up", count=count, cutoff=cutoff.isoformat())
+        with get_cursor(autocommit=True) as cur:
+            cur.execute(query)
+            partitions = cur.fetchall()
+        
+        count = 0
+        for row in partitions:
+            name = row['relname']
+            year, month = int(name[-6:-2]), int(name[-2:])
+            # Partition upper bound is the first day of the following month
+            upper = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+            if upper + lifetime > cutoff:
+                continue
             
-            return count
+            try:
+                if row['attached']:
+                    # WHY FINALIZE: A concurrent detach interrupted on an
+                    # earlier run leaves the partition detach-pending
+                    detach = "FINALIZE" if row['inhdetachpending'] else "CONCURRENTLY"
+                    with get_cursor(autocommit=True) as cur:
+                        cur.execute(sql.SQL("ALTER TABLE sessions DETACH PARTITION {} {}").format(
+                            sql.Identifier(name), sql.SQL(detach)
+                        ))
+                
+                with get_cursor() as cur:
+                    cur.execute(
+                        "SELECT set_config('lock_timeout', %s, true)",
+                        (str(PARTITION_LOCK_TIMEOUT_MS),)
+                    )
+                    cur.execute(sql.SQL("DROP TABLE {}").format(sql.Identifier(name)))
+                count += 1
+            except errors.LockNotAvailable:
+                logger.warning("Session partition busy, retrying next run", partition=name)
+        
+        logger.info("Expired session partitions dropped", count=count, cutoff=cutoff.isoformat())
+        
+        return count
     except DatabaseError:
         raise
     except Exception as e:
         logger.error("Failed to cleanup sessions", error=str(e))
         raise DatabaseError(f"Failed to cleanup sessions: {e}")
-
-
-# Import timedelta for cleanup function
-from datetime import timedelta
@@ -97,6 +97,14 @@ def transaction(
                 if readonly:
                     cur.execute("SET TRANSACTION READ ONLY")
                 
+                if config.pgbouncer:
+                    # WHY local: Lasts exactly as long as this transaction,
+                    # which is all a transaction-mode pooler guarantees
+                    cur.execute(
+                        "SELECT set_config('statement_timeout', %s, true)",
+                        (str(timeout * 1000),)
+                    )
+                
                 logger.debug(
                     "Transaction started",
                     isolation=isolation_level.value,
@@ -10,12 +10,21 @@ from typing import Optional, Tuple
 import hmac
 import hashlib
 import structlog
+from cryptography.hazmat.primitives import hashes, hmac as openssl_hmac
 
-from utils import get_cursor, is_within_clock_skew, DatabaseError
+from utils import get_cursor, stream_query, is_within_clock_skew, DatabaseError
 from config import get_config
 
 logger = structlog.get_logger(__name__)
 
+# WHY threshold: cryptography's HMAC releases the GIL during the digest,
+# but below ~2KB the binding overhead costs more than it saves
+OPENSSL_HMAC_MIN_BYTES = 2048
+
+# Bloom filter sizing for processed webhook IDs (RedisBloom BF.INSERT)
+WEBHOOK_FILTER_ERROR_RATE = 0.001
+WEBHOOK_FILTER_CAPACITY = 1_000_000
+
 
 class WebhookError(Exception):
     """Base webhook error."""
@@ -32,6 +41,25 @@ class WebhookDuplicateError(WebhookError):
     pass
 
 
+def _compute_signature(secret: bytes, timestamp: int, payload: bytes) -> str:
+    """
+    Compute Stripe v1 signature (HMAC-SHA256 of "{timestamp}.{payload}").
+    
+    WHY two backends: Large payloads go through OpenSSL so concurrent
+    verifications in worker threads are not serialized on the GIL.
+    Small payloads stay on stdlib hmac, which is faster for them.
+    """
+    prefix = f"{timestamp}.".encode()
+    
+    if len(payload) >= OPENSSL_HMAC_MIN_BYTES:
+        h = openssl_hmac.HMAC(secret, hashes.SHA256())
+        h.update(prefix)
+        h.update(payload)
+        return h.finalize().hex()
+    
+    return hmac.new(secret, prefix + payload, hashlib.sha256).hexdigest()
+
+
 def verify_stripe_signature(
     payload: bytes,
     signature_header: str,
@@ -69,12 +97,7 @@ def verify_stripe_signature(
             return (False, "Timestamp outside tolerance")
         
         # Compute expected signature
-        signed_payload = f"{timestamp}.".encode() + payload
-        expected_sig = hmac.new(
-            secret.encode(),
-            signed_payload,
-            hashlib.sha256
-        ).hexdigest()
+        expected_sig = _compute_signature(secret.encode(), timestamp, payload)
         
         # Constant-time comparison
         for sig in signatures:
@@ -88,11 +111,143 @@ def verify_stripe_signature(
         return (False, f"Verification error: {e}")
 
 
+def _webhook_filter_key(provider: str) -> str:
+    return f"bf:{provider}:webhooks"
+
+
+def _webhook_filter_insert(r, key: str, webhook_ids: list, create: bool = True) -> None:
+    """
+    Add IDs to the filter, creating it with our sizing if it is missing.
+    
+    WHY BF.INSERT over BF.ADD/BF.MADD: Those auto-create the filter with
+    RedisBloom's defaults (capacity 100, 1% error), after which a
+    BF.RESERVE fails and WEBHOOK_FILTER_* never take effect.
+    
+    Args:
+        create: If False, fail instead of creating a missing filter
+    """
+    if create:
+        options = ('CAPACITY', WEBHOOK_FILTER_CAPACITY, 'ERROR', WEBHOOK_FILTER_ERROR_RATE)
+    else:
+        options = ('NOCREATE',)
+    r.execute_command('BF.INSERT', key, *options, 'ITEMS', *webhook_ids)
+
+
+def _webhook_filter_might_contain(webhook_id: str, provider: str) -> bool:
+    """
+    Check the Redis Bloom filter for a webhook ID.
+    
+    WHY Bloom filter: Stripe retries hit the dedupe check repeatedly, and
+    a negative lets first deliveries skip the DB SELECT.
+    WHY a negative can be wrong: IDs recorded while Redis was down, or
+    while the filter was being reseeded, are missing from it. Duplicates
+    are still rejected because record_webhook raises
+    WebhookDuplicateError when its INSERT hits the unique constraint.
+    WHY a missing filter answers True: After a flush or eviction, BF.EXISTS
+    reports every ID absent. Fall back to the DB until a reseed.
+    
+    Returns:
+        False if the ID is not in the filter
+    """
+    # WHY lazy import: middleware imports services at module load
+    from middleware.rate_limit import get_redis
+    
+    key = _webhook_filter_key(provider)
+    
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.execute_command('BF.EXISTS', key, webhook_id)
+        filter_exists, might_contain = pipe.execute()
+        return not filter_exists or bool(might_contain)
+    except Exception as e:
+        # WHY fail open: Fall through to the DB check on any Redis error
+        logger.warning("Webhook filter check failed", webhook_id=webhook_id, error=str(e))
+        return True
+
+
+def _webhook_filter_add(webhook_id: str, provider: str) -> None:
+    """
+    Add a webhook ID to the Redis Bloom filter.
+    
+    WHY NOCREATE: Recreating a flushed or evicted filter here would hold
+    only new IDs, and seed_webhook_filter(if_missing=True) would then
+    skip it for good. A missing filter stays missing until reseeded.
+    """
+    from middleware.rate_limit import get_redis
+    
+    try:
+        _webhook_filter_insert(get_redis(), _webhook_filter_key(provider), [webhook_id], create=False)
+    except Exception as e:
+        # WHY not raise: Filter miss only costs a DB round-trip later
+        logger.warning("Webhook filter add failed", webhook_id=webhook_id, error=str(e))
+
+
+def seed_webhook_filter(
+    provider: str = "stripe",
+    batch_size: int = 1000,
+    if_missing: bool = False
+) -> int:
+    """
+    Seed the Bloom filter from processed_webhooks.
+    
+    Runs at application startup and on a schedule with if_missing=True,
+    so a filter lost to a Redis flush or eviction is rebuilt. Until then
+    the dedupe check falls back to the DB.
+    
+    WHY stream_query: processed_webhooks grows without bound; a
+    client-side cursor would buffer every ID before the first batch.
+    
+    Args:
+        provider: Webhook provider
+        batch_size: IDs per BF.INSERT call
+        if_missing: Skip seeding when the filter already exists
+        
+    Returns:
+        Number of webhook IDs added
+    """
+    from middleware.rate_limit import get_redis
+    
+    r = get_redis()
+    key = _webhook_filter_key(provider)
+    
+    if if_missing and r.exists(key):
+        return 0
+    
+    query = """
+        SELECT webhook_id FROM processed_webhooks
+        WHERE provider = %s
+    """
+    
+    count = 0
+    batch = []
+    for row in stream_query(query, (provider,), itersize=batch_size):
+        batch.append(row['webhook_id'])
+        if len(batch) >= batch_size:
+            _webhook_filter_insert(r, key, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        _webhook_filter_insert(r, key, batch)
+        count += len(batch)
+    
+    logger.info("Webhook filter seeded", provider=provider, count=count)
+    return count
+
+
 def check_webhook_processed(
     webhook_id: str,
     provider: str = "stripe"
 ) -> bool:
-    """Check if webhook was already processed."""
+    """
+    Check if webhook was already processed.
+    
+    A False answer can be wrong (see _webhook_filter_might_contain);
+    record_webhook raising on the unique conflict is the real guard.
+    """
+    if not _webhook_filter_might_contain(webhook_id, provider):
+        return False
+    
     query = """
         SELECT id FROM processed_webhooks
         WHERE webhook_id = %s AND provider = %s
@@ -130,9 +285,10 @@ def record_webhook(
                 json.dumps(payload), status, signature_valid
             ))
             row = cur.fetchone()
-            if row:
-                return str(row['id'])
-            raise WebhookDuplicateError(f"Webhook {webhook_id} already processed")
+        _webhook_filter_add(webhook_id, provider)
+        if row:
+            return str(row['id'])
+        raise WebhookDuplicateError(f"Webhook {webhook_id} already processed")
     except WebhookDuplicateError:
         raise
     except Exception as e:
@@ -9,12 +9,14 @@ from utils.crypto import (
     hmac_verify,
     generate_token_hash,
     generate_request_hash,
+    generate_legacy_request_hash,
     generate_idempotency_key,
     generate_request_id,
     sign_pagination_cursor,
     verify_pagination_cursor,
     sign_audit_entry,
     verify_audit_entry,
+    verify_audit_entries,
     constant_time_compare,
 )
 
@@ -24,6 +26,7 @@ from utils.database import (
     get_connection,
     get_cursor,
     execute_query,
+    stream_query,
     is_within_clock_skew,
     soft_delete,
     health_check,
@@ -40,12 +43,14 @@ __all__ = [
     'hmac_verify',
     'generate_token_hash',
     'generate_request_hash',
+    'generate_legacy_request_hash',
     'generate_idempotency_key',
     'generate_request_id',
     'sign_pagination_cursor',
     'verify_pagination_cursor',
     'sign_audit_entry',
     'verify_audit_entry',
+    'verify_audit_entries',
     'constant_time_compare',
     # Database
     'init_connection_pool',
@@ -53,6 +58,7 @@ __all__ = [
     'get_connection',
     'get_cursor',
     'execute_query',
+    'stream_query',
     'is_within_clock_skew',
     'soft_delete',
     'health_check',
@@ -8,11 +8,38 @@ single point of security review.
 
 import hashlib
 import hmac
-import secrets
 import base64
+import binascii
 import json
-from typing import Optional, Any
-from datetime import datetime, timezone
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Any, Iterable
+
+import blake3
+
+# Per-thread scratch buffer for minting pagination cursors
+_cursor_scratch = threading.local()
+CURSOR_BUFFER_SIZE = 2048
+
+# Per-thread pool of OS randomness for IDs and keys
+_rand_pool = threading.local()
+RAND_POOL_SIZE = 4096
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """
+    Serialize to compact, key-sorted JSON bytes.
+    
+    WHY stdlib json only: Hashes and signatures over this output are
+    compared across processes. orjson is not byte-identical to json
+    (1e301 vs 1e+301, non-str keys, big ints), so using it where
+    installed would make the same input hash differently elsewhere.
+    """
+    return json.dumps(
+        obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    ).encode('utf-8')
 
 
 def sha256_hash(data: str | bytes) -> str:
@@ -33,6 +60,18 @@ def sha256_hash(data: str | bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+@lru_cache(maxsize=8)
+def _hmac_prototype(secret: bytes) -> hmac.HMAC:
+    """
+    Keyed HMAC-SHA256 object with no message fed yet.
+    
+    WHY cache: Secrets are constant for the process lifetime. copy()
+    clones the already-padded inner/outer state instead of re-deriving
+    ipad/opad on every signature. Small maxsize covers key rotation.
+    """
+    return hmac.new(key=secret, msg=None, digestmod='sha256')
+
+
 def hmac_sign(data: str | bytes, secret: str) -> str:
     """
     Create HMAC-SHA256 signature for data integrity.
@@ -52,11 +91,9 @@ def hmac_sign(data: str | bytes, secret: str) -> str:
     if isinstance(secret, str):
         secret = secret.encode('utf-8')
     
-    return hmac.new(
-        key=secret,
-        msg=data,
-        digestmod=hashlib.sha256
-    ).hexdigest()
+    h = _hmac_prototype(secret).copy()
+    h.update(data)
+    return h.hexdigest()
 
 
 def hmac_verify(data: str | bytes, signature: str, secret: str) -> bool:
@@ -96,26 +133,83 @@ def generate_token_hash(jwt_token: str) -> str:
     return sha256_hash(jwt_token)
 
 
-def generate_request_hash(body: bytes, headers: dict | None = None) -> str:
+def generate_request_hash(
+    body: bytes | bytearray | memoryview,
+    headers: dict | None = None
+) -> str:
     """
     Generate hash of request for idempotency verification.
     
     WHY include headers: Some operations may be header-dependent.
     Default to body-only for simplicity.
+    WHY streaming update: Large bodies are hashed in place through the
+    buffer protocol instead of being copied into a combined buffer.
+    WHY BLAKE3: This is a payload-equality check, not a signature. BLAKE3
+    is SIMD-parallel and several times faster than SHA-256 on large
+    bodies. No fallback: every process must produce the same digest for
+    the same body, or retries would be reported as conflicts.
+    WHY length=32: 64 hex chars fits idempotency_keys.request_hash.
     
     Args:
-        body: Request body bytes
+        body: Request body bytes (any buffer-protocol object)
         headers: Optional headers to include in hash
         
     Returns:
-        SHA-256 hash of request
+        BLAKE3-256 hash of request (hex)
     """
+    h = blake3.blake3()
+    h.update(body)
     if headers:
         # Include specific headers in hash
+        h.update(b'|')
+        h.update(_canonical_json(headers))
+    return h.hexdigest(length=32)
+
+
+def generate_legacy_request_hash(
+    body: bytes | bytearray | memoryview,
+    headers: dict | None = None
+) -> str:
+    """
+    Pre-BLAKE3 request hash (SHA-256), byte-for-byte the old format.
+    
+    WHY kept: idempotency_keys rows live 48 hours. Keys stored before the
+    switch to BLAKE3 hold this digest, and a retry of them must still
+    match instead of returning 409.
+    
+    Remove on or after 2026-10-17: the 48-hour key TTL after the
+    2026-10-15 release that switched to BLAKE3. Drop the fallbacks in
+    services/idempotency.py with it.
+    
+    Returns:
+        SHA-256 hash of request (hex)
+    """
+    if headers:
         header_data = json.dumps(headers, sort_keys=True).encode('utf-8')
-        combined = body + b'|' + header_data
-        return sha256_hash(combined)
-    return sha256_hash(body)
+        return hashlib.sha256(bytes(body) + b'|' + header_data).hexdigest()
+    return hashlib.sha256(body).hexdigest()
+
+
+def _random_bytes(n: int) -> bytes:
+    """
+    Take n bytes from the calling thread's pool of OS randomness.
+    
+    WHY pool: os.urandom is a getrandom(2) syscall per call. One 4KB read
+    serves 100+ IDs. Bytes come from the same CSPRNG and each is handed
+    out exactly once.
+    WHY pid check: A pool inherited across fork (gunicorn prefork) would
+    give every worker the same bytes, so the child discards it.
+    """
+    pid = os.getpid()
+    pool = getattr(_rand_pool, 'buf', None)
+    pos = getattr(_rand_pool, 'pos', 0)
+    if pool is None or _rand_pool.pid != pid or pos + n > len(pool):
+        pool = os.urandom(max(RAND_POOL_SIZE, n))
+        _rand_pool.buf = pool
+        _rand_pool.pid = pid
+        pos = 0
+    _rand_pool.pos = pos + n
+    return pool[pos:pos + n]
 
 
 def generate_idempotency_key() -> str:
@@ -127,7 +221,7 @@ def generate_idempotency_key() -> str:
     Returns:
         URL-safe base64 encoded random string
     """
-    return secrets.token_urlsafe(32)
+    return base64.urlsafe_b64encode(_random_bytes(32)).rstrip(b'=').decode('ascii')
 
 
 def generate_request_id() -> str:
@@ -136,13 +230,15 @@ def generate_request_id() -> str:
     
     WHY include timestamp: Enables rough time ordering without
     querying, useful for log correlation.
+    WHY hex milliseconds: time_ns() is a single vDSO call, no datetime
+    or strftime allocation. Fixed width keeps IDs lexically sortable
+    and within audit_logs.request_id (VARCHAR 36).
     
     Returns:
-        Unique request identifier
+        Unique request identifier (34 characters)
     """
-    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')
-    random_part = secrets.token_hex(8)
-    return f"req_{timestamp}_{random_part}"
+    millis = time.time_ns() // 1_000_000
+    return f"req_{millis:013x}_{_random_bytes(8).hex()}"
 
 
 def sign_pagination_cursor(cursor_data: dict, secret: str) -> str:
@@ -152,35 +248,46 @@ def sign_pagination_cursor(cursor_data: dict, secret: str) -> str:
     WHY signed cursors: Prevents attackers from forging cursors
     to access unauthorized data (PRD §15).
     
+    WHY payload.sig layout: The canonical payload is serialized once and
+    signed as-is, so there is no second JSON pass or wrapper dict.
+    
     Args:
         cursor_data: Cursor payload (offset, filters, etc.)
         secret: HMAC secret
         
     Returns:
-        Base64 encoded signed cursor
+        Base64 encoded signed cursor (unpadded)
     """
-    # Serialize cursor data
-    payload = json.dumps(cursor_data, sort_keys=True, default=str)
-    
-    # Create signature
-    signature = hmac_sign(payload, secret)
+    payload = _canonical_json(cursor_data)
+    h = _hmac_prototype(secret.encode('utf-8')).copy()
+    h.update(payload)
+    signature = binascii.hexlify(h.digest())
     
-    # Combine payload and signature
-    combined = {
-        'data': cursor_data,
-        'sig': signature
-    }
+    # WHY scratch buffer: payload.sig is assembled in a reused per-thread
+    # bytearray instead of allocating intermediate concatenations
+    n = len(payload)
+    size = n + 1 + len(signature)
+    buf = getattr(_cursor_scratch, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(max(size, CURSOR_BUFFER_SIZE))
+        _cursor_scratch.buf = buf
+    buf[:n] = payload
+    buf[n] = 0x2E  # b'.'
+    buf[n + 1:size] = signature
     
     # Base64 encode for URL safety
-    return base64.urlsafe_b64encode(
-        json.dumps(combined).encode('utf-8')
-    ).decode('utf-8')
+    with memoryview(buf) as view:
+        encoded = base64.urlsafe_b64encode(view[:size])
+    return encoded.rstrip(b'=').decode('ascii')
 
 
 def verify_pagination_cursor(cursor: str, secret: str) -> Optional[dict]:
     """
     Verify and decode signed pagination cursor.
     
+    WHY verify raw bytes: The signature covers the exact payload bytes,
+    so nothing is re-serialized before comparison.
+    
     Args:
         cursor: Signed cursor string
         secret: HMAC secret
@@ -189,20 +296,20 @@ def verify_pagination_cursor(cursor: str, secret: str) -> Optional[dict]:
         Cursor data if valid, None if tampered or invalid
     """
     try:
-        # Decode base64
-        decoded = base64.urlsafe_b64decode(cursor.encode('utf-8'))
-        combined = json.loads(decoded)
+        # Restore stripped base64 padding
+        padded = cursor + '=' * (-len(cursor) % 4)
+        decoded = base64.urlsafe_b64decode(padded.encode('ascii'))
         
-        # Extract components
-        cursor_data = combined.get('data')
-        signature = combined.get('sig')
+        # WHY rsplit: Payload JSON may contain dots, the hex signature cannot
+        payload, sep, signature = decoded.rpartition(b'.')
+        if not sep or not payload or not signature:
+            return None
         
-        if not cursor_data or not signature:
+        if not hmac_verify(payload, signature.decode('ascii'), secret):
             return None
         
-        # Verify signature
-        payload = json.dumps(cursor_data, sort_keys=True, default=str)
-        if not hmac_verify(payload, signature, secret):
+        cursor_data = json.loads(payload)
+        if not isinstance(cursor_data, dict) or not cursor_data:
             return None
         
         return cursor_data
@@ -227,6 +334,8 @@ def sign_audit_entry(entry_data: dict, secret: str) -> str:
     """
     # Create canonical representation of entry
     # WHY sort_keys: Deterministic serialization
+    # WHY stdlib json here: Stored signatures were computed over this exact
+    # byte format, changing encoders would fail verify_log_integrity
     payload = json.dumps(entry_data, sort_keys=True, default=str)
     return hmac_sign(payload, secret)
 
@@ -247,6 +356,37 @@ def verify_audit_entry(entry_data: dict, signature: str, secret: str) -> bool:
     return hmac.compare_digest(expected, signature)
 
 
+def verify_audit_entries(
+    entries: Iterable[tuple[dict, str]],
+    secret: str
+) -> list[bool]:
+    """
+    Verify many audit log entries in one pass.
+    
+    WHY batch: In integrity sweeps the per-call setup (secret encoding,
+    HMAC prototype lookup, function dispatch) costs more than the
+    SHA-256 work. It is done once here, so the loop only serializes,
+    hashes and compares. Same canonical format as sign_audit_entry.
+    
+    Args:
+        entries: (entry_data, stored_signature) pairs
+        secret: HMAC secret
+        
+    Returns:
+        One bool per entry, True if unmodified
+    """
+    proto = _hmac_prototype(secret.encode('utf-8'))
+    dumps = json.dumps
+    compare = hmac.compare_digest
+    
+    results = []
+    for entry_data, signature in entries:
+        h = proto.copy()
+        h.update(dumps(entry_data, sort_keys=True, default=str).encode('utf-8'))
+        results.append(compare(h.hexdigest(), signature))
+    return results
+
+
 def constant_time_compare(a: str, b: str) -> bool:
     """
     Constant-time string comparison.
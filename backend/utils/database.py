@@ -6,20 +6,39 @@ WHY centralized DB access: Consistent timeout handling,
 circuit breaker integration, and proper cleanup.
 """
 
+import atexit
 import contextlib
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import datetime, timezone
 from typing import Optional, Any, Generator
-import psycopg2
-from psycopg2 import pool, sql, errors
-from psycopg2.extras import RealDictCursor
+import psycopg
+from psycopg import sql, errors
+from psycopg.rows import RowFactory, dict_row, tuple_row
+from psycopg.types.json import set_json_loads
+from psycopg.types.string import TextLoader
+from psycopg_pool import ConnectionPool, PoolTimeout
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import get_config, DatabaseConfig
 
 logger = structlog.get_logger(__name__)
 
 # Module-level connection pool (singleton pattern)
-_connection_pool: Optional[pool.ThreadedConnectionPool] = None
+_connection_pool: Optional[ConnectionPool] = None
+
+# statement_timeout (ms) applied at connect time via libpq options
+_default_timeout_ms: Optional[int] = None
+
+# True when connecting through PgBouncer in transaction pooling mode
+_pgbouncer: bool = False
+
+# WHY 10: Two connect_timeout attempts, then give up on startup
+POOL_OPEN_TIMEOUT_SECONDS = 10
 
 
 class DatabaseError(Exception):
@@ -42,16 +61,32 @@ class SerializationError(DatabaseError):
     pass
 
 
+def _configure_connection(conn: psycopg.Connection) -> None:
+    """
+    Per-connection setup run once when the pool opens a connection.
+    
+    WHY text loaders: Callers treat UUID and INET columns as strings.
+    psycopg3 would otherwise return uuid.UUID and ipaddress objects.
+    WHY orjson loads: JSON/JSONB columns (details, score_factors, rule
+    definitions) decode in C. Same dicts and lists as json.loads.
+    """
+    conn.adapters.register_loader("uuid", TextLoader)
+    conn.adapters.register_loader("inet", TextLoader)
+    if orjson is not None:
+        set_json_loads(orjson.loads, conn)
+
+
 def init_connection_pool(config: Optional[DatabaseConfig] = None) -> None:
     """
     Initialize the database connection pool.
     
-    WHY ThreadedConnectionPool: Safe for multi-threaded Flask apps.
+    WHY psycopg_pool: Thread-safe with low lock contention (condition
+    variables, background connection management) for multi-threaded Flask.
     WHY pool: Reuse connections instead of creating new ones per request.
     
     Must be called once during application startup.
     """
-    global _connection_pool
+    global _connection_pool, _default_timeout_ms, _pgbouncer
     
     if config is None:
         config = get_config().database
@@ -60,25 +95,66 @@ def init_connection_pool(config: Optional[DatabaseConfig] = None) -> None:
         logger.warning("Connection pool already initialized, skipping")
         return
     
+    _default_timeout_ms = config.default_timeout * 1000
+    _pgbouncer = config.pgbouncer
+    
+    connect_kwargs = {
+        # WHY row_factory: Return dicts instead of tuples for clarity
+        'row_factory': dict_row,
+        # WHY connect_timeout: Fail fast if DB unreachable
+        'connect_timeout': 5,
+    }
+    if config.pgbouncer:
+        # WHY no prepared statements: They live on one server connection,
+        # and the next transaction may run on another. None also turns
+        # explicit prepare=True calls into plain executes.
+        connect_kwargs['prepare_threshold'] = None
+        # WHY no options: PgBouncer rejects the options startup parameter.
+        # statement_timeout is set per transaction instead (transaction()),
+        # and the default should be set on the role:
+        # ALTER ROLE ... SET statement_timeout = '30s'
+        connect_kwargs['application_name'] = 'ed-base'
+    else:
+        # WHY application_name: Identify connections in pg_stat_activity
+        # WHY statement_timeout here: Applied once at connect, so the
+        # common default-timeout checkout needs no extra round-trip
+        connect_kwargs['options'] = (
+            f"-c application_name=ed-base "
+            f"-c statement_timeout={_default_timeout_ms}"
+        )
+    
     try:
         # WHY these pool settings: Per PRD §14
         # min=5: Always have connections ready
         # max=20: Prevent connection exhaustion
-        _connection_pool = pool.ThreadedConnectionPool(
-            minconn=config.pool_min,
-            maxconn=config.pool_max,
-            dsn=config.url,
-            # WHY cursor_factory: Return dicts instead of tuples for clarity
-            cursor_factory=RealDictCursor,
-            # WHY connect_timeout: Fail fast if DB unreachable
-            connect_timeout=5,
-            # WHY application_name: Identify connections in pg_stat_activity
-            options=f"-c application_name=ed-base"
+        _connection_pool = ConnectionPool(
+            conninfo=config.url,
+            min_size=config.pool_min,
+            max_size=config.pool_max,
+            max_idle=config.pool_idle_timeout,
+            max_lifetime=config.pool_max_lifetime,
+            kwargs=connect_kwargs,
+            configure=_configure_connection,
+            open=True
         )
+        # WHY wait: open=True connects in background threads that retry
+        # quietly. Waiting for min_size connections makes an unreachable
+        # database fail startup instead of the first request's getconn.
+        try:
+            _connection_pool.wait(timeout=POOL_OPEN_TIMEOUT_SECONDS)
+        except PoolTimeout as e:
+            _connection_pool.close()
+            _connection_pool = None
+            logger.error("Failed to initialize connection pool", error=str(e))
+            raise DatabaseConnectionError(f"Failed to initialize pool: {e}")
+        # WHY atexit: Workers exit without an explicit shutdown hook; close
+        # stops the pool's worker threads and ends backend sessions cleanly
+        atexit.register(close_connection_pool)
         logger.info("Database connection pool initialized", 
                    min_conn=config.pool_min, 
-                   max_conn=config.pool_max)
-    except psycopg2.Error as e:
+                   max_conn=config.pool_max,
+                   pgbouncer=config.pgbouncer)
+    except psycopg.Error as e:
         logger.error("Failed to initialize connection pool", error=str(e))
         raise DatabaseConnectionError(f"Failed to initialize pool: {e}")
 
@@ -91,7 +167,7 @@ def close_connection_pool() -> None:
     global _connection_pool
     
     if _connection_pool is not None:
-        _connection_pool.closeall()
+        _connection_pool.close()
         _connection_pool = None
         logger.info("Database connection pool closed")
 
@@ -119,20 +195,32 @@ def get_connection(timeout: Optional[int] = None) -> Generator:
     config = get_config().database
     timeout = timeout or config.default_timeout
     
+    timeout_ms = timeout * 1000
+    
     conn = None
     try:
         conn = _connection_pool.getconn()
-        if conn is None:
-            raise DatabaseConnectionError("Failed to get connection from pool")
         
         # WHY set statement_timeout per connection: Different operations
         # have different timeout requirements (PRD §14)
-        with conn.cursor() as cur:
-            cur.execute(f"SET statement_timeout = '{timeout * 1000}'")
+        # WHY track on the connection: Skip the round-trip when the pooled
+        # connection already has the requested timeout
+        # WHY skipped for PgBouncer: A session-level SET would stick to
+        # whichever server connection ran it and leak to other clients
+        if not _pgbouncer and getattr(conn, '_ed_timeout_ms', _default_timeout_ms) != timeout_ms:
+            # WHY set_config: SET cannot take bind parameters
+            # WHY commit: Leaves the connection idle so callers can change
+            # autocommit and start their own transaction
+            conn.execute(
+                "SELECT set_config('statement_timeout', %s, false)",
+                (str(timeout_ms),)
+            )
+            conn.commit()
+            conn._ed_timeout_ms = timeout_ms
         
         yield conn
         
-    except pool.PoolError as e:
+    except PoolTimeout as e:
         logger.error("Pool error", error=str(e))
         raise DatabaseConnectionError(f"Pool error: {e}")
     finally:
@@ -150,13 +238,19 @@ def get_cursor(
     
     WHY separate cursor context: Most operations just need a cursor,
     not direct connection access.
+    WHY a cursor per checkout, closed on exit: A cursor cached on the
+    pooled connection would pin its last result set until the next
+    checkout. Prepared statements live on the connection, so repeated
+    queries keep them either way.
     
     Args:
         timeout: Query timeout in seconds
-        autocommit: If True, each statement commits immediately
+        autocommit: If True, each statement commits immediately. Use for
+            single-statement reads: psycopg otherwise sends BEGIN and
+            COMMIT as separate round-trips around the SELECT.
         
     Yields:
-        Database cursor (RealDictCursor)
+        Database cursor (dict rows)
     """
     with get_connection(timeout) as conn:
         conn.autocommit = autocommit
@@ -171,12 +265,19 @@ def execute_query(
     params: Optional[tuple] = None,
     timeout: Optional[int] = None,
     fetch_one: bool = False,
-    fetch_all: bool = True
-) -> Optional[list | dict]:
+    fetch_all: bool = True,
+    columns: Optional[tuple[str, ...]] = None
+) -> Optional[list | dict | tuple]:
     """
     Execute a query and return results.
     
     WHY wrapper function: Consistent error handling and logging.
+    WHY tuple rows: Skips per-row dict building in the driver. Callers
+    that want dicts pass the column names they selected and get one
+    zip() per row.
+    WHY prepare=True: Queries routed through this wrapper repeat. psycopg
+    prepares them server-side on first use and later calls send only
+    BIND/EXECUTE. The driver keeps a per-connection LRU of statements.
     
     Args:
         query: SQL query string
@@ -184,6 +285,7 @@ def execute_query(
         timeout: Query timeout
         fetch_one: Return single row
         fetch_all: Return all rows (default)
+        columns: Column names to map rows into dicts (tuples if omitted)
         
     Returns:
         Query results or None for non-SELECT queries
@@ -194,15 +296,22 @@ def execute_query(
     """
     try:
         with get_cursor(timeout) as cur:
-            cur.execute(query, params)
+            cur.row_factory = tuple_row
+            cur.execute(query, params, prepare=True)
             
             if cur.description is None:  # Non-SELECT query
                 return None
             
             if fetch_one:
-                return cur.fetchone()
+                row = cur.fetchone()
+                if row is not None and columns:
+                    return dict(zip(columns, row))
+                return row
             if fetch_all:
-                return cur.fetchall()
+                rows = cur.fetchall()
+                if columns:
+                    return [dict(zip(columns, row)) for row in rows]
+                return rows
             return None
             
     except errors.QueryCanceled as e:
@@ -211,7 +320,58 @@ def execute_query(
     except errors.SerializationFailure as e:
         logger.warning("Serialization conflict", query=query[:100])
         raise SerializationError(f"Serialization conflict: {e}")
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
+        logger.error("Database error", error=str(e), query=query[:100])
+        raise DatabaseError(f"Database error: {e}")
+
+
+def stream_query(
+    query: str,
+    params: Optional[tuple | list] = None,
+    timeout: Optional[int] = None,
+    itersize: int = 1000,
+    row_factory: Optional[RowFactory] = None
+) -> Generator[Any, None, None]:
+    """
+    Yield rows from a server-side cursor.
+    
+    WHY server-side cursor: fetchall() materializes the whole result in
+    the client before the caller builds its own objects from it. Rows
+    arrive in batches of itersize, so memory stays bounded regardless
+    of result size.
+    WHY a transaction: Named cursors only live inside one. The
+    connection is held until the generator is exhausted or closed.
+    
+    Args:
+        query: SQL query string
+        params: Query parameters
+        timeout: Query timeout
+        itersize: Rows fetched per round-trip
+        row_factory: Row factory for the cursor (dict rows if omitted)
+        
+    Yields:
+        Row dicts, or rows built by row_factory
+        
+    Raises:
+        QueryTimeoutError: If query times out
+        DatabaseError: For other database errors
+    """
+    try:
+        with get_connection(timeout) as conn:
+            conn.autocommit = False
+            try:
+                with conn.cursor(name='ed_stream', row_factory=row_factory or conn.row_factory) as cur:
+                    cur.itersize = itersize
+                    cur.execute(query, params)
+                    yield from cur
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    except errors.QueryCanceled as e:
+        logger.warning("Query timeout", query=query[:100])
+        raise QueryTimeoutError(f"Query timed out: {e}")
+    except psycopg.Error as e:
         logger.error("Database error", error=str(e), query=query[:100])
         raise DatabaseError(f"Database error: {e}")
 
@@ -233,14 +393,25 @@ def is_within_clock_skew(
     Returns:
         True if timestamp within tolerance of current time
     """
-    now = datetime.now(timezone.utc)
-    
     # Handle timezone-naive timestamps
     if timestamp.tzinfo is None:
         timestamp = timestamp.replace(tzinfo=timezone.utc)
     
-    delta = abs((now - timestamp).total_seconds())
-    return delta <= tolerance_seconds
+    # WHY epoch seconds: time.time() avoids allocating a datetime and a
+    # timedelta for what is a single float comparison
+    return abs(time.time() - timestamp.timestamp()) <= tolerance_seconds
+
+
+_SOFT_DELETE_SQL = sql.SQL("""
+    UPDATE {table}
+    SET deleted_at = %s, updated_at = %s
+    WHERE {id_col} = %s AND deleted_at IS NULL
+""")
+
+# WHY cache composed SQL: (table, id_column) pairs come from a small fixed
+# set in code. Identifier quoting runs once per pair, and the stable text
+# also lets psycopg reuse its prepared statement.
+_soft_delete_queries: dict[tuple[str, str], str] = {}
 
 
 def soft_delete(
@@ -264,22 +435,22 @@ def soft_delete(
     Returns:
         True if record was soft deleted
     """
-    query = sql.SQL("""
-        UPDATE {table}
-        SET deleted_at = %s, updated_at = %s
-        WHERE {id_col} = %s AND deleted_at IS NULL
-    """).format(
-        table=sql.Identifier(table),
-        id_col=sql.Identifier(id_column)
-    )
-    
     now = datetime.now(timezone.utc)
     
     try:
         with get_cursor(timeout) as cur:
+            query = _soft_delete_queries.get((table, id_column))
+            if query is None:
+                # WHY as_string(cur): psycopg3 needs a connection to quote identifiers
+                query = _SOFT_DELETE_SQL.format(
+                    table=sql.Identifier(table),
+                    id_col=sql.Identifier(id_column)
+                ).as_string(cur)
+                _soft_delete_queries[(table, id_column)] = query
+            
             cur.execute(query, (now, now, id_value))
             return cur.rowcount > 0
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         logger.error("Soft delete failed", table=table, id=str(id_value), error=str(e))
         raise DatabaseError(f"Soft delete failed: {e}")
 
@@ -288,16 +459,29 @@ def health_check() -> dict:
     """
     Perform database health check.
     
+    WHY raw connection: Load balancers probe this every tick. Skipping
+    get_cursor/execute_query avoids the per-call timeout change, prepare
+    and commit; autocommit means no BEGIN/COMMIT around the SELECT.
+    WHY default timeout: The pooled connection already carries it, so
+    no set_config round-trip is needed.
+    WHY restore autocommit: The connection goes back to the pool, and the
+    next borrower may rely on the implicit BEGIN and rollback.
+    
     Returns:
         Health status dict with is_healthy, latency_ms, and error
     """
-    start = datetime.now(timezone.utc)
+    start = time.perf_counter()
     
     try:
-        # Simple query to verify connectivity
-        result = execute_query("SELECT 1 as healthy", timeout=5)
+        with get_connection() as conn:
+            previous = conn.autocommit
+            conn.autocommit = True
+            try:
+                conn.execute("SELECT 1").fetchone()
+            finally:
+                conn.autocommit = previous
         
-        latency = (datetime.now(timezone.utc) - start).total_seconds() * 1000
+        latency = (time.perf_counter() - start) * 1000
         
         return {
             'is_healthy': True,
@@ -305,7 +489,7 @@ def health_check() -> dict:
             'error': None
         }
     except Exception as e:
-        latency = (datetime.now(timezone.utc) - start).total_seconds() * 1000
+        latency = (time.perf_counter() - start) * 1000
         return {
             'is_healthy': False,
             'latency_ms': round(latency, 2),
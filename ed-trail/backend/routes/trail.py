@@ -3,12 +3,21 @@ ED-TRAIL API Routes
 Uses ED-BASE middleware unchanged.
 """
 
-from flask import Blueprint, request, jsonify, g
+from datetime import datetime
+import json
+from flask import Blueprint, Response, request, jsonify, g
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import sys
 sys.path.insert(0, '../../../backend')
 
+from config import get_config
+from utils import sign_pagination_cursor, verify_pagination_cursor
 from middleware import require_auth, require_team, safe_handler, rate_limit
 from services import IdempotencyContext
 from ed_trail.backend.services import (
@@ -25,6 +34,29 @@ logger = structlog.get_logger(__name__)
 
 trail_bp = Blueprint('trail', __name__, url_prefix='/api/trail')
 
+HIGH_RISK_PAGE_SIZE = 50
+
+
+def _iso_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_response(payload: dict | list) -> Response:
+    """
+    Serialize a GET endpoint response.
+    
+    WHY orjson: Encodes the whole payload in C, including datetimes, so
+    handlers pass raw datetime values instead of calling isoformat()
+    per field. Falls back to stdlib json with the same ISO 8601 output.
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, default=_iso_default)
+    return Response(body, mimetype='application/json')
+
 
 # ============ DATA SOURCES ============
 
@@ -38,7 +70,11 @@ def create_source():
     
     idempotency_key = request.headers.get('Idempotency-Key')
     if idempotency_key:
-        with IdempotencyContext(idempotency_key, g.user_id, request.get_data()) as ctx:
+        # WHY cache=True: get_json() already buffered the body; this returns
+        # the same bytes object instead of reading the stream again.
+        # Only requests carrying a key pay for the raw body at all.
+        body = request.get_data(cache=True)
+        with IdempotencyContext(idempotency_key, g.user_id, body) as ctx:
             if not ctx.should_process:
                 return jsonify(ctx.response)
             
@@ -68,12 +104,12 @@ def create_source():
 @safe_handler
 def get_sources():
     sources = list_data_sources(g.team_id, g.user_id)
-    return jsonify([{
+    return _json_response([{
         'id': s.id,
         'name': s.name,
         'source_type': s.source_type,
         'is_active': s.is_active,
-        'last_seen_at': s.last_seen_at.isoformat() if s.last_seen_at else None
+        'last_seen_at': s.last_seen_at
     } for s in sources])
 
 
@@ -85,14 +121,14 @@ def get_source(source_id):
     source = get_data_source(source_id, g.team_id, g.user_id)
     if not source:
         return jsonify({'error': 'Source not found'}), 404
-    return jsonify({
+    return _json_response({
         'id': source.id,
         'name': source.name,
         'source_type': source.source_type,
         'connection_config': source.connection_config,
         'is_active': source.is_active,
-        'last_seen_at': source.last_seen_at.isoformat() if source.last_seen_at else None,
-        'created_at': source.created_at.isoformat()
+        'last_seen_at': source.last_seen_at,
+        'created_at': source.created_at
     })
 
 
@@ -127,7 +163,7 @@ def get_assets():
     orphans_only = request.args.get('orphans_only', 'false').lower() == 'true'
     
     assets = list_data_assets(g.team_id, g.user_id, source_id=source_id, orphans_only=orphans_only)
-    return jsonify([{
+    return _json_response([{
         'id': a.id,
         'name': a.name,
         'asset_type': a.asset_type,
@@ -168,7 +204,7 @@ def create_edge():
 def get_lineage(asset_id):
     direction = request.args.get('direction', 'upstream')
     edges = get_asset_lineage(g.team_id, g.user_id, asset_id, direction)
-    return jsonify([{
+    return _json_response([{
         'id': e.id,
         'source_asset_id': e.source_asset_id,
         'target_asset_id': e.target_asset_id,
@@ -222,13 +258,13 @@ def get_checks():
     failed_only = request.args.get('failed_only', 'false').lower() == 'true'
     
     checks = list_checks(g.team_id, g.user_id, asset_id=asset_id, failed_only=failed_only)
-    return jsonify([{
+    return _json_response([{
         'id': c.id,
         'name': c.name,
         'check_type': c.check_type,
         'asset_id': c.asset_id,
         'last_result': c.last_result,
-        'next_run_at': c.next_run_at.isoformat() if c.next_run_at else None
+        'next_run_at': c.next_run_at
     } for c in checks])
 
 
@@ -268,14 +304,14 @@ def get_breaks():
     severity = request.args.get('severity')
     
     events = list_break_events(g.team_id, g.user_id, status=status, severity=severity)
-    return jsonify([{
+    return _json_response([{
         'id': e.id,
         'break_type': e.break_type,
         'severity': e.severity,
         'title': e.title,
         'status': e.status,
         'impact_amount_display': format_inr(e.impact_amount_paise) if e.impact_amount_paise else None,
-        'detected_at': e.detected_at.isoformat()
+        'detected_at': e.detected_at
     } for e in events])
 
 
@@ -335,7 +371,7 @@ def get_asset_score(asset_id):
     score = get_latest_score(g.team_id, g.user_id, asset_id)
     if not score:
         return jsonify({'error': 'No score found'}), 404
-    return jsonify({
+    return _json_response({
         'id': score.id,
         'overall_score': score.overall_score,
         'completeness_score': score.completeness_score,
@@ -343,7 +379,7 @@ def get_asset_score(asset_id):
         'accuracy_score': score.accuracy_score,
         'score_change': score.score_change,
         'exposure_display': format_inr(score.exposure_amount_paise) if score.exposure_amount_paise else None,
-        'computed_at': score.computed_at.isoformat()
+        'computed_at': score.computed_at
     })
 
 
@@ -353,10 +389,40 @@ def get_asset_score(asset_id):
 @safe_handler
 def get_high_risk():
     min_score = int(request.args.get('min_score', 50))
-    scores = list_scores_by_risk(g.team_id, g.user_id, min_score=min_score)
-    return jsonify([{
-        'asset_id': s.asset_id,
-        'overall_score': s.overall_score,
-        'score_change': s.score_change,
-        'exposure_display': format_inr(s.exposure_amount_paise) if s.exposure_amount_paise else None
-    } for s in scores])
+    secret = get_config().secret_key
+    
+    # WHY signed cursor: Keyset position (score, asset) of the last row
+    # seen, HMAC-signed per PRD §15 and bound to this team and filter
+    cursor_score = cursor_asset_id = None
+    cursor = request.args.get('cursor')
+    if cursor:
+        position = verify_pagination_cursor(cursor, secret)
+        if position is None or position.get('team_id') != g.team_id or position.get('min_score') != min_score:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        cursor_score, cursor_asset_id = position['score'], position['asset_id']
+    
+    try:
+        scores = list_scores_by_risk(
+            g.team_id, g.user_id, min_score=min_score, limit=HIGH_RISK_PAGE_SIZE,
+            cursor_score=cursor_score, cursor_asset_id=cursor_asset_id
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    next_cursor = None
+    if len(scores) == HIGH_RISK_PAGE_SIZE:
+        last = scores[-1]
+        next_cursor = sign_pagination_cursor({
+            'team_id': g.team_id, 'min_score': min_score,
+            'score': last.overall_score, 'asset_id': last.asset_id,
+        }, secret)
+    
+    return _json_response({
+        'scores': [{
+            'asset_id': s.asset_id,
+            'overall_score': s.overall_score,
+            'score_change': s.score_change,
+            'exposure_display': format_inr(s.exposure_amount_paise) if s.exposure_amount_paise else None
+        } for s in scores],
+        'next_cursor': next_cursor,
+    })
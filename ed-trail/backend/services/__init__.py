@@ -1,47 +1,76 @@
 """
 ED-TRAIL Services Package
+
+WHY lazy exports (PEP 562): Submodules are imported on first attribute
+access, so importing one service does not load the other five.
+WHY path setup here: The package __init__ runs once, before any
+service module, so ED-BASE's top-level packages (utils, services) are
+made importable in one place instead of at the top of every module.
 """
 
-from ed_trail.backend.services.data_sources import (
-    DataSource,
-    create_data_source,
-    get_data_source,
-    list_data_sources,
-    update_last_seen,
-)
+import importlib
+import os
+import sys
 
-from ed_trail.backend.services.data_assets import (
-    DataAsset,
-    create_data_asset,
-    get_data_asset,
-    list_data_assets,
+# Resolved from this file, not the working directory
+_ED_BASE_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..', 'backend')
 )
+if _ED_BASE_DIR not in sys.path:
+    sys.path.insert(0, _ED_BASE_DIR)
 
-from ed_trail.backend.services.lineage import (
-    LineageEdge,
-    create_lineage_edge,
-    get_asset_lineage,
-    validate_edge,
-    would_create_cycle,
-)
+_LAZY = {
+    # data_sources
+    'DataSource': 'ed_trail.backend.services.data_sources',
+    'create_data_source': 'ed_trail.backend.services.data_sources',
+    'get_data_source': 'ed_trail.backend.services.data_sources',
+    'list_data_sources': 'ed_trail.backend.services.data_sources',
+    'update_last_seen': 'ed_trail.backend.services.data_sources',
+    # data_assets
+    'DataAsset': 'ed_trail.backend.services.data_assets',
+    'create_data_asset': 'ed_trail.backend.services.data_assets',
+    'get_data_asset': 'ed_trail.backend.services.data_assets',
+    'list_data_assets': 'ed_trail.backend.services.data_assets',
+    'stream_data_assets': 'ed_trail.backend.services.data_assets',
+    # lineage
+    'LineageEdge': 'ed_trail.backend.services.lineage',
+    'create_lineage_edge': 'ed_trail.backend.services.lineage',
+    'create_lineage_edges_bulk': 'ed_trail.backend.services.lineage',
+    'get_asset_lineage': 'ed_trail.backend.services.lineage',
+    'validate_edge': 'ed_trail.backend.services.lineage',
+    'would_create_cycle': 'ed_trail.backend.services.lineage',
+    # integrity
+    'IntegrityCheck': 'ed_trail.backend.services.integrity',
+    'create_integrity_check': 'ed_trail.backend.services.integrity',
+    'record_check_result': 'ed_trail.backend.services.integrity',
+    'record_check_result_and_maybe_break': 'ed_trail.backend.services.integrity',
+    'list_checks': 'ed_trail.backend.services.integrity',
+    # breaks
+    'BreakEvent': 'ed_trail.backend.services.breaks',
+    'emit_break_event': 'ed_trail.backend.services.breaks',
+    'emit_break_events_bulk': 'ed_trail.backend.services.breaks',
+    'resolve_break_event': 'ed_trail.backend.services.breaks',
+    'list_break_events': 'ed_trail.backend.services.breaks',
+    # risk
+    'RiskScore': 'ed_trail.backend.services.risk',
+    'compute_risk_score': 'ed_trail.backend.services.risk',
+    'compute_risk_scores_bulk': 'ed_trail.backend.services.risk',
+    'get_latest_score': 'ed_trail.backend.services.risk',
+    'list_scores_by_risk': 'ed_trail.backend.services.risk',
+}
 
-from ed_trail.backend.services.integrity import (
-    IntegrityCheck,
-    create_integrity_check,
-    record_check_result,
-    list_checks,
-)
+__all__ = list(_LAZY)
 
-from ed_trail.backend.services.breaks import (
-    BreakEvent,
-    emit_break_event,
-    resolve_break_event,
-    list_break_events,
-)
 
-from ed_trail.backend.services.risk import (
-    RiskScore,
-    compute_risk_score,
-    get_latest_score,
-    list_scores_by_risk,
-)
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # WHY cache in globals: Later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
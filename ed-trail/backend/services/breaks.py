@@ -5,12 +5,10 @@ Uses ED-BASE services unchanged.
 
 from datetime import datetime, timezone
 from typing import Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import structlog
-import json
-
-import sys
-sys.path.insert(0, '../../../backend')
+from psycopg.rows import tuple_row
+import uuid
 
 from utils import get_cursor, DatabaseError
 from services import (
@@ -22,12 +20,13 @@ from services import (
     require_team_access,
     Role,
 )
-from ed_trail.backend.utils.currency import rupees_to_paise
+from ed_trail.backend.utils.currency import rupees_to_paise, rupees_to_paise_many
+from ed_trail.backend.utils.serialization import dumps_json
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakEvent:
     id: str
     team_id: str
@@ -50,6 +49,9 @@ class BreakEvent:
     created_at: datetime
 
 
+_BREAK_COLUMNS = ", ".join(f.name for f in fields(BreakEvent))
+
+
 def emit_break_event(
     team_id: str,
     user_id: str,
@@ -70,55 +72,119 @@ def emit_break_event(
     if impact_amount_rupees is not None:
         impact_paise = rupees_to_paise(impact_amount_rupees)
     
-    query = """
+    query = f"""
         INSERT INTO ed_trail_break_events (
-            team_id, check_id, asset_id, edge_id, break_type, severity,
+            id, team_id, check_id, asset_id, edge_id, break_type, severity,
             title, description, details, impact_amount_paise, created_by
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id, team_id, check_id, asset_id, edge_id, break_type, severity,
-                  title, description, details, impact_amount_paise, currency, status,
-                  resolved_at, resolved_by, resolution_notes, detected_at, created_by, created_at
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING {_BREAK_COLUMNS}
+    """
+    
+    # WHY client-side id: The audit row needs it before the INSERT
+    # returns, so both statements can go out in one pipelined round-trip
+    record_id = str(uuid.uuid4())
+    
+    with transaction(IsolationLevel.READ_COMMITTED) as cur, cur.connection.cursor() as audit_cur:
+        # WHY tuple rows: RETURNING lists _BREAK_COLUMNS in field order, so
+        # BreakEvent(*row) fills fields positionally with no per-key lookups
+        cur.row_factory = tuple_row
+        with cur.connection.pipeline():
+            cur.execute(query, (
+                record_id, team_id, check_id, asset_id, edge_id, break_type, severity,
+                title, description, dumps_json(details) if details else None, impact_paise, user_id
+            ))
+            log_event(
+                event_type=EventType.STATE_CREATE,
+                action="Emitted break event",
+                actor_id=user_id,
+                actor_type=ActorType.USER,
+                resource_type="ed_trail_break_event",
+                resource_id=record_id,
+                details={'break_type': break_type, 'severity': severity, 'title': title},
+                cursor=audit_cur
+            )
+            row = cur.fetchone()
+        
+        return BreakEvent(*row)
+
+
+# WHY 1000: 11 parameters per row keeps each statement well under
+# PostgreSQL's 65535 bind-parameter limit
+BULK_INSERT_CHUNK_SIZE = 1000
+
+_BULK_INSERT_PREFIX = """
+    INSERT INTO ed_trail_break_events (
+        team_id, check_id, asset_id, edge_id, break_type, severity,
+        title, description, details, impact_amount_paise, created_by
+    )
+    VALUES """
+_BULK_ROW = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+
+def emit_break_events_bulk(
+    team_id: str,
+    user_id: str,
+    events: List[dict]
+) -> List[str]:
     """
+    Emit many break events in one transaction.
+    
+    WHY multi-row VALUES: One round-trip and one plan per chunk instead
+    of per event. Ingest bursts were bound by per-row network latency.
+    WHY one audit entry: Records every created id with a single signed
+    log row instead of N.
     
+    Args:
+        team_id: Team UUID
+        user_id: Acting user UUID
+        events: Dicts with the keyword arguments of emit_break_event
+        
+    Returns:
+        IDs of created break events, in input order
+    """
+    require_team_access(user_id, team_id, Role.MEMBER)
+    
+    if not events:
+        return []
+    
+    impacts = rupees_to_paise_many([e.get('impact_amount_rupees') for e in events])
+    rows = [
+        (
+            team_id, e.get('check_id'), e.get('asset_id'), e.get('edge_id'),
+            e['break_type'], e.get('severity', 'medium'), e['title'], e.get('description'),
+            dumps_json(e['details']) if e.get('details') else None,
+            impact_paise, user_id
+        )
+        for e, impact_paise in zip(events, impacts)
+    ]
+    
+    ids: List[str] = []
     with transaction(IsolationLevel.READ_COMMITTED) as cur:
-        cur.execute(query, (
-            team_id, check_id, asset_id, edge_id, break_type, severity,
-            title, description, json.dumps(details) if details else None, impact_paise, user_id
-        ))
-        row = cur.fetchone()
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+            query = (
+                _BULK_INSERT_PREFIX
+                + ", ".join([_BULK_ROW] * len(chunk))
+                + " RETURNING id"
+            )
+            # WHY RETURNING order matches input: INSERT ... VALUES emits
+            # rows in VALUES-list order
+            cur.execute(query, [v for row in chunk for v in row])
+            ids.extend(r['id'] for r in cur.fetchall())
         
         log_event(
             event_type=EventType.STATE_CREATE,
-            action="Emitted break event",
+            action="Emitted break events (bulk)",
             actor_id=user_id,
             actor_type=ActorType.USER,
             resource_type="ed_trail_break_event",
-            resource_id=row['id'],
-            details={'break_type': break_type, 'severity': severity, 'title': title}
-        )
-        
-        return BreakEvent(
-            id=row['id'],
-            team_id=row['team_id'],
-            check_id=row['check_id'],
-            asset_id=row['asset_id'],
-            edge_id=row['edge_id'],
-            break_type=row['break_type'],
-            severity=row['severity'],
-            title=row['title'],
-            description=row['description'],
-            details=row['details'],
-            impact_amount_paise=row['impact_amount_paise'],
-            currency=row['currency'],
-            status=row['status'],
-            resolved_at=row['resolved_at'],
-            resolved_by=row['resolved_by'],
-            resolution_notes=row['resolution_notes'],
-            detected_at=row['detected_at'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
+            details={'count': len(ids), 'ids': ids},
+            cursor=cur
         )
+    
+    logger.info("Break events emitted", team_id=team_id, count=len(ids))
+    return ids
 
 
 def resolve_break_event(
@@ -136,11 +202,12 @@ def resolve_break_event(
         UPDATE ed_trail_break_events
         SET status = 'resolved', resolved_at = %s, resolved_by = %s, resolution_notes = %s, updated_at = %s
         WHERE id = %s AND team_id = %s AND status != 'resolved'
+        RETURNING id
     """
     
     with transaction(IsolationLevel.READ_COMMITTED) as cur:
         cur.execute(query, (now, user_id, resolution_notes, now, event_id, team_id))
-        if cur.rowcount == 0:
+        if cur.fetchone() is None:
             return False
         
         log_event(
@@ -150,11 +217,27 @@ def resolve_break_event(
             actor_type=ActorType.USER,
             resource_type="ed_trail_break_event",
             resource_id=event_id,
-            details={'resolution_notes': resolution_notes}
+            details={'resolution_notes': resolution_notes},
+            cursor=cur
         )
         return True
 
 
+# WHY precomputed: One SQL text per filter combination, built once at
+# import instead of concatenated on every call. Keyed by
+# (has_status, has_severity).
+_LIST_BREAKS_QUERIES = {
+    (has_status, has_severity): (
+        f"SELECT {_BREAK_COLUMNS} FROM ed_trail_break_events WHERE team_id = %s"
+        + (" AND status = %s" if has_status else "")
+        + (" AND severity = %s" if has_severity else "")
+        + " ORDER BY detected_at DESC LIMIT %s"
+    )
+    for has_status in (False, True)
+    for has_severity in (False, True)
+}
+
+
 def list_break_events(
     team_id: str,
     user_id: str,
@@ -162,53 +245,25 @@ def list_break_events(
     severity: Optional[str] = None,
     limit: int = 50
 ) -> List[BreakEvent]:
-    """List break events for a team."""
-    require_team_access(user_id, team_id, Role.VIEWER)
+    """
+    List break events for a team.
     
-    query = """
-        SELECT id, team_id, check_id, asset_id, edge_id, break_type, severity,
-               title, description, details, impact_amount_paise, currency, status,
-               resolved_at, resolved_by, resolution_notes, detected_at, created_by, created_at
-        FROM ed_trail_break_events
-        WHERE team_id = %s
+    WHY autocommit fetchall over stream_query: LIMIT bounds the result,
+    so a server-side cursor would only add BEGIN/DECLARE/FETCH/COMMIT
+    round-trips without lowering peak memory.
     """
-    params = [team_id]
+    require_team_access(user_id, team_id, Role.VIEWER)
     
+    query = _LIST_BREAKS_QUERIES[bool(status), bool(severity)]
+    params = [team_id]
     if status:
-        query += " AND status = %s"
         params.append(status)
-    
     if severity:
-        query += " AND severity = %s"
         params.append(severity)
-    
-    query += " ORDER BY detected_at DESC LIMIT %s"
     params.append(limit)
     
-    with get_cursor() as cur:
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        return [
-            BreakEvent(
-                id=row['id'],
-                team_id=row['team_id'],
-                check_id=row['check_id'],
-                asset_id=row['asset_id'],
-                edge_id=row['edge_id'],
-                break_type=row['break_type'],
-                severity=row['severity'],
-                title=row['title'],
-                description=row['description'],
-                details=row['details'],
-                impact_amount_paise=row['impact_amount_paise'],
-                currency=row['currency'],
-                status=row['status'],
-                resolved_at=row['resolved_at'],
-                resolved_by=row['resolved_by'],
-                resolution_notes=row['resolution_notes'],
-                detected_at=row['detected_at'],
-                created_by=row['created_by'],
-                created_at=row['created_at']
-            )
-            for row in rows
-        ]
+    with get_cursor(autocommit=True) as cur:
+        # WHY tuple rows: _BREAK_COLUMNS follows field order for BreakEvent(*row)
+        cur.row_factory = tuple_row
+        cur.execute(query, params, prepare=True)
+        return [BreakEvent(*row) for row in cur.fetchall()]
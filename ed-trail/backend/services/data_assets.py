@@ -4,14 +4,13 @@ Uses ED-BASE services unchanged.
 """
 
 from datetime import datetime, timezone
-from typing import Optional, List
-from dataclasses import dataclass
+from typing import Iterator, List, Optional
+from dataclasses import dataclass, fields
 import structlog
+from psycopg.rows import tuple_row
+import uuid
 
-import sys
-sys.path.insert(0, '../../../backend')
-
-from utils import get_cursor, DatabaseError
+from utils import get_cursor, stream_query, DatabaseError
 from services import (
     transaction,
     IsolationLevel,
@@ -25,7 +24,7 @@ from services import (
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataAsset:
     id: str
     team_id: str
@@ -40,6 +39,9 @@ class DataAsset:
     created_at: datetime
 
 
+_ASSET_COLUMNS = ", ".join(f.name for f in fields(DataAsset))
+
+
 def create_data_asset(
     team_id: str,
     user_id: str,
@@ -53,69 +55,65 @@ def create_data_asset(
     
     origin_unknown = source_id is None
     
-    query = """
-        INSERT INTO ed_trail_data_assets (team_id, source_id, name, asset_type, identifier, origin_unknown, created_by)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        RETURNING id, team_id, source_id, name, asset_type, identifier, origin_unknown, version, is_active, created_by, created_at
+    query = f"""
+        INSERT INTO ed_trail_data_assets (id, team_id, source_id, name, asset_type, identifier, origin_unknown, created_by)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING {_ASSET_COLUMNS}
     """
     
-    with transaction(IsolationLevel.READ_COMMITTED) as cur:
-        cur.execute(query, (team_id, source_id, name, asset_type, identifier, origin_unknown, user_id))
-        row = cur.fetchone()
-        
-        log_event(
-            event_type=EventType.STATE_CREATE,
-            action="Registered data asset",
-            actor_id=user_id,
-            actor_type=ActorType.USER,
-            resource_type="ed_trail_data_asset",
-            resource_id=row['id'],
-            details={'name': name, 'asset_type': asset_type, 'origin_unknown': origin_unknown}
-        )
+    record_id = str(uuid.uuid4())
+    
+    with transaction(IsolationLevel.READ_COMMITTED) as cur, cur.connection.cursor() as audit_cur:
+        # WHY tuple rows: _ASSET_COLUMNS follows field order for DataAsset(*row)
+        cur.row_factory = tuple_row
+        with cur.connection.pipeline():
+            cur.execute(query, (record_id, team_id, source_id, name, asset_type, identifier, origin_unknown, user_id))
+            log_event(
+                event_type=EventType.STATE_CREATE,
+                action="Registered data asset",
+                actor_id=user_id,
+                actor_type=ActorType.USER,
+                resource_type="ed_trail_data_asset",
+                resource_id=record_id,
+                details={'name': name, 'asset_type': asset_type, 'origin_unknown': origin_unknown},
+                cursor=audit_cur
+            )
+            row = cur.fetchone()
         
-        return DataAsset(
-            id=row['id'],
-            team_id=row['team_id'],
-            source_id=row['source_id'],
-            name=row['name'],
-            asset_type=row['asset_type'],
-            identifier=row['identifier'],
-            origin_unknown=row['origin_unknown'],
-            version=row['version'],
-            is_active=row['is_active'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
-        )
+        return DataAsset(*row)
 
 
 def get_data_asset(asset_id: str, team_id: str, user_id: str) -> Optional[DataAsset]:
     """Get data asset by ID."""
     require_team_access(user_id, team_id, Role.VIEWER)
     
-    query = """
-        SELECT id, team_id, source_id, name, asset_type, identifier, origin_unknown, version, is_active, created_by, created_at
+    query = f"""
+        SELECT {_ASSET_COLUMNS}
         FROM ed_trail_data_assets
         WHERE id = %s AND team_id = %s
     """
     
-    with get_cursor() as cur:
-        cur.execute(query, (asset_id, team_id))
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(query, (asset_id, team_id), prepare=True)
         row = cur.fetchone()
         if not row:
             return None
-        return DataAsset(
-            id=row['id'],
-            team_id=row['team_id'],
-            source_id=row['source_id'],
-            name=row['name'],
-            asset_type=row['asset_type'],
-            identifier=row['identifier'],
-            origin_unknown=row['origin_unknown'],
-            version=row['version'],
-            is_active=row['is_active'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
-        )
+        return DataAsset(*row)
+
+
+# Keyed by (has_source, orphans_only)
+_LIST_ASSETS_QUERIES = {
+    (has_source, orphans_only): (
+        f"SELECT {_ASSET_COLUMNS} FROM ed_trail_data_assets"
+        " WHERE team_id = %s AND is_active = true"
+        + (" AND source_id = %s" if has_source else "")
+        + (" AND origin_unknown = true" if orphans_only else "")
+        + " ORDER BY created_at DESC"
+    )
+    for has_source in (False, True)
+    for orphans_only in (False, True)
+}
 
 
 def list_data_assets(
@@ -124,41 +122,46 @@ def list_data_assets(
     source_id: Optional[str] = None,
     orphans_only: bool = False
 ) -> List[DataAsset]:
-    """List data assets for a team."""
+    """
+    List data assets for a team.
+    
+    WHY fetchall over stream_query: The whole list is returned, so the
+    pooled connection is released and database errors are raised here,
+    not while the route serializes. stream_data_assets is the streaming
+    variant for exports.
+    """
     require_team_access(user_id, team_id, Role.VIEWER)
     
-    query = """
-        SELECT id, team_id, source_id, name, asset_type, identifier, origin_unknown, version, is_active, created_by, created_at
-        FROM ed_trail_data_assets
-        WHERE team_id = %s AND is_active = true
+    query = _LIST_ASSETS_QUERIES[bool(source_id), bool(orphans_only)]
+    params = [team_id, source_id] if source_id else [team_id]
+    
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(query, params, prepare=True)
+        return [DataAsset(*row) for row in cur.fetchall()]
+
+
+def stream_data_assets(
+    team_id: str,
+    user_id: str,
+    source_id: Optional[str] = None,
+    orphans_only: bool = False
+) -> Iterator[DataAsset]:
     """
-    params = [team_id]
+    Yield a team's data assets from a server-side cursor, for exports.
     
-    if source_id:
-        query += " AND source_id = %s"
-        params.append(source_id)
+    Same filters and order as list_data_assets, with memory bounded by
+    stream_query's batch size instead of the asset count.
     
-    if orphans_only:
-        query += " AND origin_unknown = true"
+    WHY separate from list_data_assets: The generator holds a pooled
+    connection and an open transaction until it is exhausted or closed,
+    and database errors surface while iterating. Callers must consume
+    it fully or close() it.
+    """
+    require_team_access(user_id, team_id, Role.VIEWER)
     
-    query += " ORDER BY created_at DESC"
+    query = _LIST_ASSETS_QUERIES[bool(source_id), bool(orphans_only)]
+    params = [team_id, source_id] if source_id else [team_id]
     
-    with get_cursor() as cur:
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        return [
-            DataAsset(
-                id=row['id'],
-                team_id=row['team_id'],
-                source_id=row['source_id'],
-                name=row['name'],
-                asset_type=row['asset_type'],
-                identifier=row['identifier'],
-                origin_unknown=row['origin_unknown'],
-                version=row['version'],
-                is_active=row['is_active'],
-                created_by=row['created_by'],
-                created_at=row['created_at']
-            )
-            for row in rows
-        ]
+    for row in stream_query(query, params, row_factory=tuple_row):
+        yield DataAsset(*row)
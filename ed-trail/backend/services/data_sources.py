@@ -4,12 +4,11 @@ Uses ED-BASE services unchanged.
 """
 
 from datetime import datetime, timezone
-from typing import Optional, List
-from dataclasses import dataclass
+from typing import List, Optional
+from dataclasses import dataclass, fields
 import structlog
-
-import sys
-sys.path.insert(0, '../../../backend')
+from psycopg.rows import tuple_row
+import uuid
 
 from utils import get_cursor, DatabaseError
 from services import (
@@ -21,11 +20,12 @@ from services import (
     require_team_access,
     Role,
 )
+from ed_trail.backend.utils.serialization import dumps_json
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSource:
     id: str
     team_id: str
@@ -38,6 +38,14 @@ class DataSource:
     created_at: datetime
 
 
+# Columns in DataSource field order; a NULL connection_config reads as {}
+_SOURCE_COLUMNS = ", ".join(
+    "COALESCE(connection_config, '{}'::jsonb) AS connection_config"
+    if f.name == 'connection_config' else f.name
+    for f in fields(DataSource)
+)
+
+
 def create_data_source(
     team_id: str,
     user_id: str,
@@ -48,100 +56,74 @@ def create_data_source(
     """Create a new data source."""
     require_team_access(user_id, team_id, Role.MEMBER)
     
-    query = """
-        INSERT INTO ed_trail_data_sources (team_id, name, source_type, connection_config, created_by)
-        VALUES (%s, %s, %s, %s, %s)
-        RETURNING id, team_id, name, source_type, connection_config, is_active, last_seen_at, created_by, created_at
+    query = f"""
+        INSERT INTO ed_trail_data_sources (id, team_id, name, source_type, connection_config, created_by)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        RETURNING {_SOURCE_COLUMNS}
     """
     
-    import json
-    config_json = json.dumps(connection_config or {})
+    config_json = dumps_json(connection_config or {})
     
-    with transaction(IsolationLevel.READ_COMMITTED) as cur:
-        cur.execute(query, (team_id, name, source_type, config_json, user_id))
-        row = cur.fetchone()
-        
-        log_event(
-            event_type=EventType.STATE_CREATE,
-            action="Created data source",
-            actor_id=user_id,
-            actor_type=ActorType.USER,
-            resource_type="ed_trail_data_source",
-            resource_id=row['id'],
-            details={'name': name, 'source_type': source_type}
-        )
+    record_id = str(uuid.uuid4())
+    
+    with transaction(IsolationLevel.READ_COMMITTED) as cur, cur.connection.cursor() as audit_cur:
+        # WHY tuple rows: _SOURCE_COLUMNS follows field order for DataSource(*row)
+        cur.row_factory = tuple_row
+        with cur.connection.pipeline():
+            cur.execute(query, (record_id, team_id, name, source_type, config_json, user_id))
+            log_event(
+                event_type=EventType.STATE_CREATE,
+                action="Created data source",
+                actor_id=user_id,
+                actor_type=ActorType.USER,
+                resource_type="ed_trail_data_source",
+                resource_id=record_id,
+                details={'name': name, 'source_type': source_type},
+                cursor=audit_cur
+            )
+            row = cur.fetchone()
         
-        return DataSource(
-            id=row['id'],
-            team_id=row['team_id'],
-            name=row['name'],
-            source_type=row['source_type'],
-            connection_config=row['connection_config'] or {},
-            is_active=row['is_active'],
-            last_seen_at=row['last_seen_at'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
-        )
+        return DataSource(*row)
 
 
 def get_data_source(source_id: str, team_id: str, user_id: str) -> Optional[DataSource]:
     """Get data source by ID."""
     require_team_access(user_id, team_id, Role.VIEWER)
     
-    query = """
-        SELECT id, team_id, name, source_type, connection_config, is_active, last_seen_at, created_by, created_at
+    query = f"""
+        SELECT {_SOURCE_COLUMNS}
         FROM ed_trail_data_sources
         WHERE id = %s AND team_id = %s
     """
     
-    with get_cursor() as cur:
-        cur.execute(query, (source_id, team_id))
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(query, (source_id, team_id), prepare=True)
         row = cur.fetchone()
         if not row:
             return None
-        return DataSource(
-            id=row['id'],
-            team_id=row['team_id'],
-            name=row['name'],
-            source_type=row['source_type'],
-            connection_config=row['connection_config'] or {},
-            is_active=row['is_active'],
-            last_seen_at=row['last_seen_at'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
-        )
+        return DataSource(*row)
+
+
+# Keyed by active_only
+_LIST_SOURCES_QUERIES = {
+    active_only: (
+        f"SELECT {_SOURCE_COLUMNS} FROM ed_trail_data_sources WHERE team_id = %s"
+        + (" AND is_active = true" if active_only else "")
+        + " ORDER BY created_at DESC"
+    )
+    for active_only in (False, True)
+}
 
 
 def list_data_sources(team_id: str, user_id: str, active_only: bool = True) -> List[DataSource]:
     """List all data sources for a team."""
     require_team_access(user_id, team_id, Role.VIEWER)
     
-    query = """
-        SELECT id, team_id, name, source_type, connection_config, is_active, last_seen_at, created_by, created_at
-        FROM ed_trail_data_sources
-        WHERE team_id = %s
-    """
-    if active_only:
-        query += " AND is_active = true"
-    query += " ORDER BY created_at DESC"
-    
-    with get_cursor() as cur:
-        cur.execute(query, (team_id,))
-        rows = cur.fetchall()
-        return [
-            DataSource(
-                id=row['id'],
-                team_id=row['team_id'],
-                name=row['name'],
-                source_type=row['source_type'],
-                connection_config=row['connection_config'] or {},
-                is_active=row['is_active'],
-                last_seen_at=row['last_seen_at'],
-                created_by=row['created_by'],
-                created_at=row['created_at']
-            )
-            for row in rows
-        ]
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(_LIST_SOURCES_QUERIES[bool(active_only)], (team_id,), prepare=True)
+        return [DataSource(*row) for row in cur.fetchall()]
 
 
 def update_last_seen(source_id: str, team_id: str) -> None:
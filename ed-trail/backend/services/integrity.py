@@ -4,13 +4,11 @@ Uses ED-BASE services unchanged.
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List
-from dataclasses import dataclass
+from typing import List, Optional
+from dataclasses import dataclass, fields
 import structlog
-import json
-
-import sys
-sys.path.insert(0, '../../../backend')
+from psycopg.rows import tuple_row
+import uuid
 
 from utils import get_cursor, DatabaseError
 from services import (
@@ -22,11 +20,12 @@ from services import (
     require_team_access,
     Role,
 )
+from ed_trail.backend.utils.serialization import dumps_json
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegrityCheck:
     id: str
     team_id: str
@@ -45,6 +44,9 @@ class IntegrityCheck:
     created_at: datetime
 
 
+_CHECK_COLUMNS = ", ".join(f.name for f in fields(IntegrityCheck))
+
+
 def create_integrity_check(
     team_id: str,
     user_id: str,
@@ -65,51 +67,38 @@ def create_integrity_check(
     if frequency_minutes:
         next_run = datetime.now(timezone.utc) + timedelta(minutes=frequency_minutes)
     
-    query = """
+    query = f"""
         INSERT INTO ed_trail_integrity_checks (
-            team_id, asset_id, edge_id, name, check_type, rule_definition,
+            id, team_id, asset_id, edge_id, name, check_type, rule_definition,
             frequency_minutes, next_run_at, created_by
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id, team_id, asset_id, edge_id, name, check_type, rule_definition,
-                  frequency_minutes, last_run_at, next_run_at, last_result, last_result_details,
-                  is_active, created_by, created_at
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING {_CHECK_COLUMNS}
     """
     
-    with transaction(IsolationLevel.READ_COMMITTED) as cur:
-        cur.execute(query, (
-            team_id, asset_id, edge_id, name, check_type, json.dumps(rule_definition),
-            frequency_minutes, next_run, user_id
-        ))
-        row = cur.fetchone()
-        
-        log_event(
-            event_type=EventType.STATE_CREATE,
-            action="Created integrity check",
-            actor_id=user_id,
-            actor_type=ActorType.USER,
-            resource_type="ed_trail_integrity_check",
-            resource_id=row['id'],
-            details={'name': name, 'check_type': check_type}
-        )
+    record_id = str(uuid.uuid4())
+    
+    with transaction(IsolationLevel.READ_COMMITTED) as cur, cur.connection.cursor() as audit_cur:
+        # WHY tuple rows: _CHECK_COLUMNS follows field order for IntegrityCheck(*row)
+        cur.row_factory = tuple_row
+        with cur.connection.pipeline():
+            cur.execute(query, (
+                record_id, team_id, asset_id, edge_id, name, check_type, dumps_json(rule_definition),
+                frequency_minutes, next_run, user_id
+            ))
+            log_event(
+                event_type=EventType.STATE_CREATE,
+                action="Created integrity check",
+                actor_id=user_id,
+                actor_type=ActorType.USER,
+                resource_type="ed_trail_integrity_check",
+                resource_id=record_id,
+                details={'name': name, 'check_type': check_type},
+                cursor=audit_cur
+            )
+            row = cur.fetchone()
         
-        return IntegrityCheck(
-            id=row['id'],
-            team_id=row['team_id'],
-            asset_id=row['asset_id'],
-            edge_id=row['edge_id'],
-            name=row['name'],
-            check_type=row['check_type'],
-            rule_definition=row['rule_definition'],
-            frequency_minutes=row['frequency_minutes'],
-            last_run_at=row['last_run_at'],
-            next_run_at=row['next_run_at'],
-            last_result=row['last_result'],
-            last_result_details=row['last_result_details'],
-            is_active=row['is_active'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
-        )
+        return IntegrityCheck(*row)
 
 
 def record_check_result(
@@ -137,11 +126,111 @@ def record_check_result(
     
     with transaction(IsolationLevel.READ_COMMITTED) as cur:
         cur.execute(query, (
-            now, result, json.dumps(result_details) if result_details else None,
+            now, result, dumps_json(result_details) if result_details else None,
             now, now, check_id, team_id
         ))
 
 
+def record_check_result_and_maybe_break(
+    check_id: str,
+    team_id: str,
+    user_id: str,
+    result: str,
+    result_details: Optional[dict] = None,
+    severity: str = 'medium'
+) -> Optional[str]:
+    """
+    Record a check result and, on 'fail' or 'error', emit a break event.
+    
+    WHY one statement: The failure path used to be record_check_result
+    followed by emit_break_event, two transactions and two commits. The
+    data-modifying CTE updates the check and inserts the break in one
+    round-trip and one commit. The audit entry joins that commit too.
+    
+    Args:
+        check_id: Integrity check UUID
+        team_id: Team UUID
+        user_id: User recorded as creator of the break event
+        result: 'pass', 'fail', 'warning' or 'error'
+        result_details: Optional result payload, copied to the break
+        severity: Severity of the emitted break event
+        
+    Returns:
+        ID of the emitted break event, or None if none was emitted
+    """
+    require_team_access(user_id, team_id, Role.MEMBER)
+    
+    now = datetime.now(timezone.utc)
+    details_json = dumps_json(result_details) if result_details else None
+    
+    query = """
+        WITH upd AS (
+            UPDATE ed_trail_integrity_checks
+            SET last_run_at = %(now)s,
+                last_result = %(result)s,
+                last_result_details = %(details)s,
+                next_run_at = CASE
+                    WHEN frequency_minutes IS NOT NULL
+                    THEN %(now)s + (frequency_minutes * interval '1 minute')
+                    ELSE NULL
+                END,
+                updated_at = %(now)s
+            WHERE id = %(check_id)s AND team_id = %(team_id)s
+            RETURNING id, asset_id, edge_id, name
+        ),
+        ins AS (
+            INSERT INTO ed_trail_break_events (
+                team_id, check_id, asset_id, edge_id, break_type, severity,
+                title, details, created_by
+            )
+            SELECT %(team_id)s::uuid, upd.id, upd.asset_id, upd.edge_id, 'data_mismatch', %(severity)s,
+                   left('Integrity check ' || %(result)s || ': ' || upd.name, 255),
+                   %(details)s::jsonb, %(user_id)s::uuid
+            FROM upd
+            WHERE %(result)s IN ('fail', 'error')
+            RETURNING id
+        )
+        SELECT id FROM ins
+    """
+    
+    with transaction(IsolationLevel.READ_COMMITTED) as cur:
+        cur.execute(query, {
+            'now': now, 'result': result, 'details': details_json,
+            'check_id': check_id, 'team_id': team_id,
+            'severity': severity, 'user_id': user_id,
+        })
+        row = cur.fetchone()
+        if row is None:
+            return None
+        
+        log_event(
+            event_type=EventType.STATE_CREATE,
+            action="Emitted break event",
+            actor_id=user_id,
+            actor_type=ActorType.USER,
+            resource_type="ed_trail_break_event",
+            resource_id=row['id'],
+            details={'check_id': check_id, 'result': result, 'severity': severity},
+            cursor=cur
+        )
+    
+    return row['id']
+
+
+# Keyed by (has_asset, failed_only)
+_LIST_CHECKS_QUERIES = {
+    (has_asset, failed_only): (
+        f"SELECT {_CHECK_COLUMNS} FROM ed_trail_integrity_checks"
+        " WHERE team_id = %s AND is_active = true"
+        + (" AND asset_id = %s" if has_asset else "")
+        + (" AND last_result IN ('fail', 'error')" if failed_only else "")
+        + " ORDER BY created_at DESC"
+    )
+    for has_asset in (False, True)
+    for failed_only in (False, True)
+}
+
+
 def list_checks(
     team_id: str,
     user_id: str,
@@ -151,44 +240,10 @@ def list_checks(
     """List integrity checks for a team."""
     require_team_access(user_id, team_id, Role.VIEWER)
     
-    query = """
-        SELECT id, team_id, asset_id, edge_id, name, check_type, rule_definition,
-               frequency_minutes, last_run_at, next_run_at, last_result, last_result_details,
-               is_active, created_by, created_at
-        FROM ed_trail_integrity_checks
-        WHERE team_id = %s AND is_active = true
-    """
-    params = [team_id]
-    
-    if asset_id:
-        query += " AND asset_id = %s"
-        params.append(asset_id)
+    query = _LIST_CHECKS_QUERIES[bool(asset_id), bool(failed_only)]
+    params = [team_id, asset_id] if asset_id else [team_id]
     
-    if failed_only:
-        query += " AND last_result IN ('fail', 'error')"
-    
-    query += " ORDER BY created_at DESC"
-    
-    with get_cursor() as cur:
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        return [
-            IntegrityCheck(
-                id=row['id'],
-                team_id=row['team_id'],
-                asset_id=row['asset_id'],
-                edge_id=row['edge_id'],
-                name=row['name'],
-                check_type=row['check_type'],
-                rule_definition=row['rule_definition'],
-                frequency_minutes=row['frequency_minutes'],
-                last_run_at=row['last_run_at'],
-                next_run_at=row['next_run_at'],
-                last_result=row['last_result'],
-                last_result_details=row['last_result_details'],
-                is_active=row['is_active'],
-                created_by=row['created_by'],
-                created_at=row['created_at']
-            )
-            for row in rows
-        ]
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(query, params, prepare=True)
+        return [IntegrityCheck(*row) for row in cur.fetchall()]
@@ -4,12 +4,12 @@ Uses ED-BASE services unchanged.
 """
 
 from datetime import datetime, timezone
-from typing import Optional, List
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from typing import Any, Optional, List
+from dataclasses import dataclass, fields
 import structlog
-
-import sys
-sys.path.insert(0, '../../../backend')
+from psycopg.rows import tuple_row
+import uuid
 
 from utils import get_cursor, DatabaseError
 from services import (
@@ -25,7 +25,7 @@ from services import (
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LineageEdge:
     id: str
     team_id: str
@@ -41,27 +41,46 @@ class LineageEdge:
     created_at: datetime
 
 
-def would_create_cycle(team_id: str, source_asset_id: str, target_asset_id: str) -> bool:
-    """Check if adding this edge would create a cycle."""
+_EDGE_COLUMNS = ", ".join(f.name for f in fields(LineageEdge))
+
+# WHY per-team lock: Same key as the closure trigger (migration 007).
+# Held until commit, so a concurrent edge insert for the team waits
+# until this one's edge and closure pairs are visible.
+_LOCK_TEAM_LINEAGE_SQL = "SELECT ed_trail_lock_lineage(%s)"
+
+
+def would_create_cycle(
+    team_id: str,
+    source_asset_id: str,
+    target_asset_id: str,
+    cursor: Optional[Any] = None
+) -> bool:
+    """
+    Check if adding this edge would create a cycle.
+    
+    WHY closure lookup: The edge closes a cycle iff target already
+    reaches source. ed_trail_lineage_closure (migration 007) stores every
+    reachable pair, so this is one primary-key probe, not a graph walk.
+    WHY EXISTS: Always returns exactly one boolean row, and the executor
+    stops at the first matching index entry.
+    WHY optional cursor: Without one this is an advisory read. Writers
+    pass their transaction's cursor after taking the team lineage lock,
+    so nothing can change the answer before their insert commits.
+    """
     query = """
-        WITH RECURSIVE lineage AS (
-            SELECT source_asset_id, target_asset_id, 1 as depth
-            FROM ed_trail_lineage_edges
-            WHERE team_id = %s AND target_asset_id = %s AND is_active = true
-            
-            UNION ALL
-            
-            SELECT e.source_asset_id, e.target_asset_id, l.depth + 1
-            FROM ed_trail_lineage_edges e
-            JOIN lineage l ON e.target_asset_id = l.source_asset_id
-            WHERE e.team_id = %s AND e.is_active = true AND l.depth < 100
-        )
-        SELECT 1 FROM lineage WHERE source_asset_id = %s LIMIT 1
+        SELECT EXISTS (
+            SELECT 1 FROM ed_trail_lineage_closure
+            WHERE team_id = %s AND ancestor_id = %s AND descendant_id = %s
+        ) AS reaches
     """
     
-    with get_cursor() as cur:
-        cur.execute(query, (team_id, source_asset_id, team_id, target_asset_id))
-        return cur.fetchone() is not None
+    if cursor is not None:
+        cursor.execute(query, (team_id, target_asset_id, source_asset_id), prepare=True)
+        return cursor.fetchone()['reaches']
+    
+    with get_cursor(autocommit=True) as cur:
+        cur.execute(query, (team_id, target_asset_id, source_asset_id), prepare=True)
+        return cur.fetchone()['reaches']
 
 
 def create_lineage_edge(
@@ -78,44 +97,161 @@ def create_lineage_edge(
     if source_asset_id == target_asset_id:
         raise ValueError("Cannot create self-loop edge")
     
-    if would_create_cycle(team_id, source_asset_id, target_asset_id):
-        raise ValueError("Edge would create cycle in lineage graph")
+    query = f"""
+        INSERT INTO ed_trail_lineage_edges (id, team_id, source_asset_id, target_asset_id, edge_type, transformation_description, created_by)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        RETURNING {_EDGE_COLUMNS}
+    """
+    
+    record_id = str(uuid.uuid4())
     
-    query = """
-        INSERT INTO ed_trail_lineage_edges (team_id, source_asset_id, target_asset_id, edge_type, transformation_description, created_by)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        RETURNING id, team_id, source_asset_id, target_asset_id, edge_type, transformation_description,
-                  is_validated, validated_at, validated_by, is_active, created_by, created_at
+    # WHY READ_COMMITTED: Each statement snapshots after the team lock is
+    # granted. REPEATABLE_READ would pin the snapshot from before the
+    # wait and miss the edges committed by the writer we waited for.
+    with transaction(IsolationLevel.READ_COMMITTED) as cur, cur.connection.cursor() as audit_cur:
+        cur.execute(_LOCK_TEAM_LINEAGE_SQL, (team_id,))
+        if would_create_cycle(team_id, source_asset_id, target_asset_id, cursor=cur):
+            raise ValueError("Edge would create cycle in lineage graph")
+        
+        # WHY tuple rows: _EDGE_COLUMNS follows field order for LineageEdge(*row)
+        cur.row_factory = tuple_row
+        with cur.connection.pipeline():
+            cur.execute(query, (record_id, team_id, source_asset_id, target_asset_id, edge_type, transformation_description, user_id))
+            log_event(
+                event_type=EventType.STATE_CREATE,
+                action="Created lineage edge",
+                actor_id=user_id,
+                actor_type=ActorType.USER,
+                resource_type="ed_trail_lineage_edge",
+                resource_id=record_id,
+                details={'source': source_asset_id, 'target': target_asset_id, 'edge_type': edge_type},
+                cursor=audit_cur
+            )
+            row = cur.fetchone()
+        
+        return LineageEdge(*row)
+
+
+# WHY 1000: 6 parameters per row keeps each statement well under
+# PostgreSQL's 65535 bind-parameter limit
+BULK_INSERT_CHUNK_SIZE = 1000
+
+_BULK_INSERT_PREFIX = """
+    INSERT INTO ed_trail_lineage_edges (
+        team_id, source_asset_id, target_asset_id, edge_type,
+        transformation_description, created_by
+    )
+    VALUES """
+_BULK_ROW = "(%s, %s, %s, %s, %s, %s)"
+
+
+def _is_acyclic(pairs: List[tuple]) -> bool:
+    """Kahn's algorithm: True if the directed graph has a topological order."""
+    successors = defaultdict(list)
+    in_degree = defaultdict(int)
+    for source, target in pairs:
+        successors[source].append(target)
+        in_degree[target] += 1
+        in_degree.setdefault(source, 0)
+    
+    ready = deque(node for node, degree in in_degree.items() if degree == 0)
+    visited = 0
+    while ready:
+        node = ready.popleft()
+        visited += 1
+        for target in successors[node]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+    return visited == len(in_degree)
+
+
+def create_lineage_edges_bulk(
+    team_id: str,
+    user_id: str,
+    edges: List[dict]
+) -> List[LineageEdge]:
     """
+    Create many lineage edges with one cycle check for the whole batch.
     
-    with transaction(IsolationLevel.REPEATABLE_READ) as cur:
-        cur.execute(query, (team_id, source_asset_id, target_asset_id, edge_type, transformation_description, user_id))
-        row = cur.fetchone()
+    WHY one topological sort: Looping over create_lineage_edge runs a
+    cycle check and a transaction per edge. Here the team's active
+    edges and the proposed ones are sorted once in Python (O(V + E)),
+    and the batch is inserted with multi-row VALUES.
+    WHY all-or-nothing: A partial import would leave a lineage graph
+    that matches neither the old state nor the requested one.
+    
+    Args:
+        team_id: Team UUID
+        user_id: Acting user UUID
+        edges: Dicts with source_asset_id, target_asset_id, edge_type
+            and optional transformation_description
+        
+    Returns:
+        Created edges, in input order
+        
+    Raises:
+        ValueError: If any edge is a self-loop or the batch adds a cycle
+    """
+    require_team_access(user_id, team_id, Role.MEMBER)
+    
+    if not edges:
+        return []
+    
+    proposed = [(e['source_asset_id'], e['target_asset_id']) for e in edges]
+    if any(source == target for source, target in proposed):
+        raise ValueError("Cannot create self-loop edge")
+    
+    rows = [
+        (
+            team_id, e['source_asset_id'], e['target_asset_id'], e['edge_type'],
+            e.get('transformation_description'), user_id
+        )
+        for e in edges
+    ]
+    
+    created: List[LineageEdge] = []
+    # WHY lock + READ_COMMITTED: The team lineage lock keeps other writers
+    # out until commit, and the edge read below snapshots after it is
+    # granted, so the cycle check and the inserts see one graph
+    with transaction(IsolationLevel.READ_COMMITTED) as cur:
+        cur.execute(_LOCK_TEAM_LINEAGE_SQL, (team_id,))
+        cur.row_factory = tuple_row
+        cur.execute(
+            """
+            SELECT source_asset_id, target_asset_id
+            FROM ed_trail_lineage_edges
+            WHERE team_id = %s AND is_active = true
+            """,
+            (team_id,)
+        )
+        existing = cur.fetchall()
+        
+        if not _is_acyclic(existing + proposed):
+            raise ValueError("Edges would create cycle in lineage graph")
+        
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+            query = (
+                _BULK_INSERT_PREFIX
+                + ", ".join([_BULK_ROW] * len(chunk))
+                + f" RETURNING {_EDGE_COLUMNS}"
+            )
+            cur.execute(query, [v for row in chunk for v in row])
+            created.extend(LineageEdge(*r) for r in cur.fetchall())
         
         log_event(
             event_type=EventType.STATE_CREATE,
-            action="Created lineage edge",
+            action="Created lineage edges (bulk)",
             actor_id=user_id,
             actor_type=ActorType.USER,
             resource_type="ed_trail_lineage_edge",
-            resource_id=row['id'],
-            details={'source': source_asset_id, 'target': target_asset_id, 'edge_type': edge_type}
-        )
-        
-        return LineageEdge(
-            id=row['id'],
-            team_id=row['team_id'],
-            source_asset_id=row['source_asset_id'],
-            target_asset_id=row['target_asset_id'],
-            edge_type=row['edge_type'],
-            transformation_description=row['transformation_description'],
-            is_validated=row['is_validated'],
-            validated_at=row['validated_at'],
-            validated_by=row['validated_by'],
-            is_active=row['is_active'],
-            created_by=row['created_by'],
-            created_at=row['created_at']
+            details={'count': len(created), 'ids': [e.id for e in created]},
+            cursor=cur
         )
+    
+    logger.info("Lineage edges created", team_id=team_id, count=len(created))
+    return created
 
 
 def get_asset_lineage(team_id: str, user_id: str, asset_id: str, direction: str = 'upstream') -> List[LineageEdge]:
@@ -123,40 +259,22 @@ def get_asset_lineage(team_id: str, user_id: str, asset_id: str, direction: str
     require_team_access(user_id, team_id, Role.VIEWER)
     
     if direction == 'upstream':
-        query = """
-            SELECT id, team_id, source_asset_id, target_asset_id, edge_type, transformation_description,
-                   is_validated, validated_at, validated_by, is_active, created_by, created_at
+        query = f"""
+            SELECT {_EDGE_COLUMNS}
             FROM ed_trail_lineage_edges
             WHERE team_id = %s AND target_asset_id = %s AND is_active = true
         """
     else:
-        query = """
-            SELECT id, team_id, source_asset_id, target_asset_id, edge_type, transformation_description,
-                   is_validated, validated_at, validated_by, is_active, created_by, created_at
+        query = f"""
+            SELECT {_EDGE_COLUMNS}
             FROM ed_trail_lineage_edges
             WHERE team_id = %s AND source_asset_id = %s AND is_active = true
         """
     
-    with get_cursor() as cur:
-        cur.execute(query, (team_id, asset_id))
-        rows = cur.fetchall()
-        return [
-            LineageEdge(
-                id=row['id'],
-                team_id=row['team_id'],
-                source_asset_id=row['source_asset_id'],
-                target_asset_id=row['target_asset_id'],
-                edge_type=row['edge_type'],
-                transformation_description=row['transformation_description'],
-                is_validated=row['is_validated'],
-                validated_at=row['validated_at'],
-                validated_by=row['validated_by'],
-                is_active=row['is_active'],
-                created_by=row['created_by'],
-                created_at=row['created_at']
-            )
-            for row in rows
-        ]
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(query, (team_id, asset_id), prepare=True)
+        return [LineageEdge(*row) for row in cur.fetchall()]
 
 
 def validate_edge(team_id: str, user_id: str, edge_id: str) -> bool:
@@ -167,13 +285,14 @@ def validate_edge(team_id: str, user_id: str, edge_id: str) -> bool:
         UPDATE ed_trail_lineage_edges
         SET is_validated = true, validated_at = %s, validated_by = %s, updated_at = %s
         WHERE id = %s AND team_id = %s
+        RETURNING id
     """
     
     now = datetime.now(timezone.utc)
     
     with transaction(IsolationLevel.READ_COMMITTED) as cur:
         cur.execute(query, (now, user_id, now, edge_id, team_id))
-        if cur.rowcount == 0:
+        if cur.fetchone() is None:
             return False
         
         log_event(
@@ -182,6 +301,7 @@ def validate_edge(team_id: str, user_id: str, edge_id: str) -> bool:
             actor_id=user_id,
             actor_type=ActorType.USER,
             resource_type="ed_trail_lineage_edge",
-            resource_id=edge_id
+            resource_id=edge_id,
+            cursor=cur
         )
         return True
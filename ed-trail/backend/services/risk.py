@@ -5,14 +5,16 @@ Uses ED-BASE services unchanged.
 
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 import structlog
+from psycopg.rows import tuple_row
 import json
-
-import sys
-sys.path.insert(0, '../../../backend')
+import uuid
+import redis
 
 from utils import get_cursor, DatabaseError
+from middleware import get_redis
 from services import (
     transaction,
     IsolationLevel,
@@ -22,12 +24,21 @@ from services import (
     require_team_access,
     Role,
 )
-from ed_trail.backend.utils.currency import rupees_to_paise
+from ed_trail.backend.utils.currency import rupees_to_paise, rupees_to_paise_many
+from ed_trail.backend.utils.serialization import dumps_json
 
 logger = structlog.get_logger(__name__)
 
+# WHY TTL: Bounds memory for assets nobody re-polls. Freshness comes from
+# the team generation check, not from expiry.
+SCORE_CACHE_TTL_SECONDS = 3600
+
+# WHY cap: Peak memory and the cached payload are O(limit), so limit is
+# the only thing that can make a listing large
+MAX_SCORES_LIMIT = 500
+
 
-@dataclass
+@dataclass(slots=True)
 class RiskScore:
     id: str
     team_id: str
@@ -45,6 +56,150 @@ class RiskScore:
     valid_until: Optional[datetime]
 
 
+# Columns in RiskScore field order; a NULL score_factors reads as {}
+_SCORE_COLUMNS = ", ".join(
+    "COALESCE(score_factors, '{}'::jsonb) AS score_factors"
+    if f.name == 'score_factors' else f.name
+    for f in fields(RiskScore)
+)
+
+
+# WHY module constants: Each statement text is built once at import.
+# Identical text on every call lets prepare=True reuse the server-side
+# prepared statement per connection.
+
+# WHY CTE: The previous score is read by the INSERT itself, so storing
+# a score is one statement instead of a SELECT round-trip then INSERT.
+# A first score for an asset has no prev row, so both stay NULL.
+# WHY ed_trail_risk_latest for "latest": A bulk batch gives repeated
+# assets one computed_at, so ORDER BY computed_at cannot tell them
+# apart. The trigger-maintained row is the last one inserted, the same
+# row compute_risk_scores_bulk chains from and the list shows.
+_INSERT_SCORE_SQL = f"""
+    WITH prev AS (
+        SELECT overall_score FROM ed_trail_risk_latest
+        WHERE team_id = %(team_id)s AND asset_id = %(asset_id)s
+    )
+    INSERT INTO ed_trail_risk_scores (
+        team_id, asset_id, overall_score, completeness_score, timeliness_score,
+        accuracy_score, score_factors, previous_score, score_change,
+        exposure_amount_paise, valid_until
+    )
+    VALUES (
+        %(team_id)s, %(asset_id)s, %(overall_score)s, %(completeness_score)s,
+        %(timeliness_score)s, %(accuracy_score)s, %(score_factors)s,
+        (SELECT overall_score FROM prev),
+        %(overall_score)s - (SELECT overall_score FROM prev),
+        %(exposure_paise)s, %(valid_until)s
+    )
+    RETURNING {_SCORE_COLUMNS}
+"""
+
+_LATEST_SCORE_SQL = f"""
+    SELECT {_SCORE_COLUMNS}
+    FROM ed_trail_risk_scores
+    WHERE id = (
+        SELECT score_id FROM ed_trail_risk_latest
+        WHERE team_id = %s AND asset_id = %s
+    )
+"""
+
+# WHY ed_trail_risk_latest: One trigger-maintained row per asset
+# (migration 011), so the scan no longer grows with score history.
+# WHY asset_id tiebreak: Equal scores need a total order for the keyset
+# cursor to resume exactly after the last row of the previous page.
+# Keyed by whether a page cursor is given.
+_SCORES_BY_RISK_QUERIES = {
+    has_cursor: f"""
+    SELECT {_SCORE_COLUMNS}
+    FROM ed_trail_risk_scores
+    JOIN (
+        SELECT score_id, overall_score AS latest_score
+        FROM ed_trail_risk_latest
+        WHERE team_id = %s AND overall_score >= %s
+        {"AND (overall_score, asset_id) < (%s, %s::uuid)" if has_cursor else ""}
+        ORDER BY overall_score DESC, asset_id DESC
+        LIMIT %s
+    ) latest ON latest.score_id = id
+    ORDER BY latest.latest_score DESC, asset_id DESC
+"""
+    for has_cursor in (False, True)
+}
+
+
+# WHY positional cache entries: Scores are cached as lists in RiskScore
+# field order. One attrgetter call reads every field, and RiskScore(*value)
+# rebuilds the score the same way the database paths do. asdict
+# deep-copies score_factors and RiskScore(**value) matches keywords.
+_SCORE_FIELDS = tuple(f.name for f in fields(RiskScore))
+_score_values = attrgetter(*_SCORE_FIELDS)
+_COMPUTED_AT = _SCORE_FIELDS.index('computed_at')
+_VALID_UNTIL = _SCORE_FIELDS.index('valid_until')
+
+# WHY versioned keys: Bumped when the entry layout changes, so entries in
+# an older layout are never decoded as the new one
+_CACHE_VERSION = 'v2'
+
+
+def _score_to_cache(score: RiskScore) -> list:
+    value = list(_score_values(score))
+    value[_COMPUTED_AT] = score.computed_at.isoformat()
+    value[_VALID_UNTIL] = score.valid_until.isoformat() if score.valid_until else None
+    return value
+
+
+def _score_from_cache(value: list) -> RiskScore:
+    value[_COMPUTED_AT] = datetime.fromisoformat(value[_COMPUTED_AT])
+    if value[_VALID_UNTIL] is not None:
+        value[_VALID_UNTIL] = datetime.fromisoformat(value[_VALID_UNTIL])
+    return RiskScore(*value)
+
+
+def _cache_get(key: str, team_id: str) -> tuple[Optional[object], Optional[bytes]]:
+    """
+    Look up a cached read for a team.
+    
+    WHY generation counter: compute_risk_score bumps risk:gen:{team}
+    after each commit. An entry is a hit only if it was stored under the
+    current generation, so any write invalidates every cached read for
+    that team at once. A counter has no cross-host clock skew, unlike
+    timestamps.
+    WHY fail open: A Redis outage falls back to Postgres.
+    
+    Returns:
+        Tuple of (cached value or None, generation seen before the read)
+    """
+    try:
+        raw, generation = get_redis().mget(key, f"risk:gen:{team_id}")
+    except redis.RedisError as e:
+        logger.warning("Risk score cache read failed", error=str(e))
+        return (None, None)
+    
+    if raw is not None:
+        entry = json.loads(raw)
+        if entry['gen'] == (generation.decode() if generation else None):
+            return (entry['value'], generation)
+    return (None, generation)
+
+
+def _cache_set(key: str, generation: Optional[bytes], value: object) -> None:
+    """Store a read under the generation observed before it ran."""
+    entry = {'gen': generation.decode() if generation else None, 'value': value}
+    try:
+        get_redis().set(key, json.dumps(entry), ex=SCORE_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning("Risk score cache write failed", error=str(e))
+
+
+def _invalidate_team_scores(team_id: str) -> None:
+    try:
+        get_redis().incr(f"risk:gen:{team_id}")
+    except redis.RedisError as e:
+        # WHY log only: The score is committed. Cached reads stay stale
+        # for at most SCORE_CACHE_TTL_SECONDS.
+        logger.error("Risk score cache invalidation failed", team_id=team_id, error=str(e))
+
+
 def compute_risk_score(
     team_id: str,
     user_id: str,
@@ -67,140 +222,233 @@ def compute_risk_score(
     if exposure_amount_rupees is not None:
         exposure_paise = rupees_to_paise(exposure_amount_rupees)
     
-    previous_query = """
-        SELECT overall_score FROM ed_trail_risk_scores
-        WHERE team_id = %s AND asset_id = %s
-        ORDER BY computed_at DESC LIMIT 1
-    """
-    
     now = datetime.now(timezone.utc)
     valid_until = now + timedelta(hours=valid_hours)
     
     with transaction(IsolationLevel.READ_COMMITTED) as cur:
-        cur.execute(previous_query, (team_id, asset_id))
-        prev_row = cur.fetchone()
-        
-        previous_score = prev_row['overall_score'] if prev_row else None
-        score_change = (overall_score - previous_score) if previous_score is not None else None
-        
-        insert_query = """
-            INSERT INTO ed_trail_risk_scores (
-                team_id, asset_id, overall_score, completeness_score, timeliness_score,
-                accuracy_score, score_factors, previous_score, score_change,
-                exposure_amount_paise, valid_until
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id, team_id, asset_id, overall_score, completeness_score, timeliness_score,
-                      accuracy_score, score_factors, previous_score, score_change,
-                      exposure_amount_paise, currency, computed_at, valid_until
-        """
-        
-        cur.execute(insert_query, (
-            team_id, asset_id, overall_score, completeness_score, timeliness_score,
-            accuracy_score, json.dumps(score_factors or {}), previous_score, score_change,
-            exposure_paise, valid_until
-        ))
-        row = cur.fetchone()
+        # WHY tuple rows: _SCORE_COLUMNS follows field order for RiskScore(*row)
+        cur.row_factory = tuple_row
+        cur.execute(_INSERT_SCORE_SQL, {
+            'team_id': team_id, 'asset_id': asset_id,
+            'overall_score': overall_score, 'completeness_score': completeness_score,
+            'timeliness_score': timeliness_score, 'accuracy_score': accuracy_score,
+            'score_factors': dumps_json(score_factors or {}),
+            'exposure_paise': exposure_paise, 'valid_until': valid_until,
+        }, prepare=True)
+        score = RiskScore(*cur.fetchone())
         
+        # WHY in this transaction, not a background queue: The score and
+        # its audit entry commit or roll back together, so a crash can
+        # never leave an unaudited score. The INSERT is queued without a
+        # fetch and costs one round-trip before commit.
+        # WHY not pipelined with the score INSERT: The signed details
+        # include score_change, which the server computes from the
+        # previous score, so the audit row cannot be built until the
+        # score row comes back.
         log_event(
             event_type=EventType.STATE_CREATE,
             action="Computed risk score",
             actor_id=user_id,
             actor_type=ActorType.USER,
             resource_type="ed_trail_risk_score",
-            resource_id=row['id'],
-            details={'asset_id': asset_id, 'overall_score': overall_score, 'change': score_change}
+            resource_id=score.id,
+            details={'asset_id': asset_id, 'overall_score': overall_score, 'change': score.score_change},
+            cursor=cur
+        )
+    
+    # WHY after commit: A reader that refills the cache between the bump
+    # and the commit would store the old score under the new generation
+    _invalidate_team_scores(team_id)
+    return score
+
+
+# WHY 1000: 11 parameters per row keeps each statement well under
+# PostgreSQL's 65535 bind-parameter limit
+BULK_INSERT_CHUNK_SIZE = 1000
+
+_BULK_INSERT_PREFIX = """
+    INSERT INTO ed_trail_risk_scores (
+        team_id, asset_id, overall_score, completeness_score, timeliness_score,
+        accuracy_score, score_factors, previous_score, score_change,
+        exposure_amount_paise, valid_until
+    )
+    VALUES """
+_BULK_ROW = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+
+def compute_risk_scores_bulk(
+    team_id: str,
+    user_id: str,
+    scores: List[dict],
+    valid_hours: int = 24
+) -> List[RiskScore]:
+    """
+    Store many computed risk scores in one transaction.
+    
+    WHY preload previous scores: One lookup in ed_trail_risk_latest for
+    every asset in the batch replaces a prev CTE per row. Repeated assets
+    chain in input order, as if stored one call at a time.
+    WHY multi-row VALUES: One round-trip per chunk instead of per score.
+    
+    Args:
+        team_id: Team UUID
+        user_id: Acting user UUID
+        scores: Dicts with the keyword arguments of compute_risk_score
+        valid_hours: Validity window applied to every score
+        
+    Returns:
+        Created scores, in input order
+        
+    Raises:
+        ValueError: If any overall_score is outside 0-100
+    """
+    require_team_access(user_id, team_id, Role.MEMBER)
+    
+    if not scores:
+        return []
+    
+    if any(not 0 <= s['overall_score'] <= 100 for s in scores):
+        raise ValueError("Score must be between 0 and 100")
+    
+    valid_until = datetime.now(timezone.utc) + timedelta(hours=valid_hours)
+    asset_ids = list({s['asset_id'] for s in scores})
+    
+    created: List[RiskScore] = []
+    with transaction(IsolationLevel.READ_COMMITTED) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(
+            """
+            SELECT asset_id, overall_score FROM ed_trail_risk_latest
+            WHERE team_id = %s AND asset_id = ANY(%s::uuid[])
+            """,
+            (team_id, asset_ids)
         )
+        latest = dict(cur.fetchall())
+        
+        exposures = rupees_to_paise_many([s.get('exposure_amount_rupees') for s in scores])
+        rows = []
+        for s, exposure_paise in zip(scores, exposures):
+            previous = latest.get(s['asset_id'])
+            latest[s['asset_id']] = s['overall_score']
+            rows.append((
+                team_id, s['asset_id'], s['overall_score'], s.get('completeness_score'),
+                s.get('timeliness_score'), s.get('accuracy_score'),
+                dumps_json(s.get('score_factors') or {}),
+                previous, s['overall_score'] - previous if previous is not None else None,
+                exposure_paise, valid_until
+            ))
         
-        return RiskScore(
-            id=row['id'],
-            team_id=row['team_id'],
-            asset_id=row['asset_id'],
-            overall_score=row['overall_score'],
-            completeness_score=row['completeness_score'],
-            timeliness_score=row['timeliness_score'],
-            accuracy_score=row['accuracy_score'],
-            score_factors=row['score_factors'] or {},
-            previous_score=row['previous_score'],
-            score_change=row['score_change'],
-            exposure_amount_paise=row['exposure_amount_paise'],
-            currency=row['currency'],
-            computed_at=row['computed_at'],
-            valid_until=row['valid_until']
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+            query = (
+                _BULK_INSERT_PREFIX
+                + ", ".join([_BULK_ROW] * len(chunk))
+                + f" RETURNING {_SCORE_COLUMNS}"
+            )
+            cur.execute(query, [v for row in chunk for v in row])
+            created.extend(RiskScore(*r) for r in cur.fetchall())
+        
+        log_event(
+            event_type=EventType.STATE_CREATE,
+            action="Computed risk scores (bulk)",
+            actor_id=user_id,
+            actor_type=ActorType.USER,
+            resource_type="ed_trail_risk_score",
+            details={'count': len(created), 'ids': [score.id for score in created]},
+            cursor=cur
         )
+    
+    _invalidate_team_scores(team_id)
+    logger.info("Risk scores computed", team_id=team_id, count=len(created))
+    return created
 
 
 def get_latest_score(team_id: str, user_id: str, asset_id: str) -> Optional[RiskScore]:
-    """Get the latest risk score for an asset."""
-    require_team_access(user_id, team_id, Role.VIEWER)
+    """
+    Get the latest risk score for an asset.
     
-    query = """
-        SELECT id, team_id, asset_id, overall_score, completeness_score, timeliness_score,
-               accuracy_score, score_factors, previous_score, score_change,
-               exposure_amount_paise, currency, computed_at, valid_until
-        FROM ed_trail_risk_scores
-        WHERE team_id = %s AND asset_id = %s
-        ORDER BY computed_at DESC LIMIT 1
+    WHY cached: Risk dashboards re-poll the same assets. Access is still
+    checked on every call; only the score row is cached.
     """
+    require_team_access(user_id, team_id, Role.VIEWER)
     
-    with get_cursor() as cur:
-        cur.execute(query, (team_id, asset_id))
+    key = f"risk:{_CACHE_VERSION}:latest:{team_id}:{asset_id}"
+    cached, generation = _cache_get(key, team_id)
+    if cached is not None:
+        return _score_from_cache(cached) if cached else None
+    
+    score = _fetch_latest_score(team_id, asset_id)
+    _cache_set(key, generation, _score_to_cache(score) if score else [])
+    return score
+
+
+def _fetch_latest_score(team_id: str, asset_id: str) -> Optional[RiskScore]:
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(_LATEST_SCORE_SQL, (team_id, asset_id), prepare=True)
         row = cur.fetchone()
         if not row:
             return None
-        return RiskScore(
-            id=row['id'],
-            team_id=row['team_id'],
-            asset_id=row['asset_id'],
-            overall_score=row['overall_score'],
-            completeness_score=row['completeness_score'],
-            timeliness_score=row['timeliness_score'],
-            accuracy_score=row['accuracy_score'],
-            score_factors=row['score_factors'] or {},
-            previous_score=row['previous_score'],
-            score_change=row['score_change'],
-            exposure_amount_paise=row['exposure_amount_paise'],
-            currency=row['currency'],
-            computed_at=row['computed_at'],
-            valid_until=row['valid_until']
-        )
+        return RiskScore(*row)
 
 
-def list_scores_by_risk(team_id: str, user_id: str, min_score: int = 0, limit: int = 50) -> List[RiskScore]:
-    """List assets sorted by risk score (highest first)."""
-    require_team_access(user_id, team_id, Role.VIEWER)
+def list_scores_by_risk(
+    team_id: str,
+    user_id: str,
+    min_score: int = 0,
+    limit: int = 50,
+    cursor_score: Optional[int] = None,
+    cursor_asset_id: Optional[str] = None
+) -> List[RiskScore]:
+    """
+    List assets sorted by risk score (highest first), ties by asset_id.
     
-    query = """
-        SELECT DISTINCT ON (asset_id)
-            id, team_id, asset_id, overall_score, completeness_score, timeliness_score,
-            accuracy_score, score_factors, previous_score, score_change,
-            exposure_amount_paise, currency, computed_at, valid_until
-        FROM ed_trail_risk_scores
-        WHERE team_id = %s AND overall_score >= %s
-        ORDER BY asset_id, computed_at DESC
+    Only each asset's latest score counts toward min_score.
+    
+    Args:
+        cursor_score: overall_score of the last row of the previous page
+        cursor_asset_id: asset_id of the last row of the previous page
+    
+    WHY keyset over OFFSET: The next page starts with an index seek past
+    the cursor, so page N costs the same as page 1.
+    
+    WHY sort and limit in SQL: Only `limit` rows cross the wire and get
+    turned into RiskScore objects, instead of one per asset in the team.
+    WHY fetchall over a named cursor: The result is already at most
+    MAX_SCORES_LIMIT rows. DECLARE/FETCH would add round-trips and a
+    transaction to bound memory that is already bounded.
     """
+    require_team_access(user_id, team_id, Role.VIEWER)
     
-    with get_cursor() as cur:
-        cur.execute(query, (team_id, min_score))
-        rows = cur.fetchall()
-        scores = [
-            RiskScore(
-                id=row['id'],
-                team_id=row['team_id'],
-                asset_id=row['asset_id'],
-                overall_score=row['overall_score'],
-                completeness_score=row['completeness_score'],
-                timeliness_score=row['timeliness_score'],
-                accuracy_score=row['accuracy_score'],
-                score_factors=row['score_factors'] or {},
-                previous_score=row['previous_score'],
-                score_change=row['score_change'],
-                exposure_amount_paise=row['exposure_amount_paise'],
-                currency=row['currency'],
-                computed_at=row['computed_at'],
-                valid_until=row['valid_until']
-            )
-            for row in rows
-        ]
-        scores.sort(key=lambda s: s.overall_score, reverse=True)
-        return scores[:limit]
+    if (cursor_score is None) != (cursor_asset_id is None):
+        raise ValueError("cursor_score and cursor_asset_id must be given together")
+    if cursor_asset_id is not None:
+        # WHY validate here: A malformed id would otherwise fail the
+        # ::uuid cast in Postgres and surface as a DatabaseError
+        try:
+            uuid.UUID(cursor_asset_id)
+        except (TypeError, ValueError, AttributeError):
+            raise ValueError("cursor_asset_id must be a UUID")
+    
+    limit = min(limit, MAX_SCORES_LIMIT)
+    after = (cursor_score, cursor_asset_id) if cursor_score is not None else None
+    key = f"risk:{_CACHE_VERSION}:list:{team_id}:{min_score}:{limit}"
+    if after:
+        key += f":{cursor_score}:{cursor_asset_id}"
+    cached, generation = _cache_get(key, team_id)
+    if cached is not None:
+        return [_score_from_cache(value) for value in cached]
+    
+    scores = _fetch_scores_by_risk(team_id, min_score, limit, after)
+    _cache_set(key, generation, [_score_to_cache(score) for score in scores])
+    return scores
+
+
+def _fetch_scores_by_risk(
+    team_id: str, min_score: int, limit: int, after: Optional[tuple]
+) -> List[RiskScore]:
+    params = (team_id, min_score, *(after or ()), limit)
+    with get_cursor(autocommit=True) as cur:
+        cur.row_factory = tuple_row
+        cur.execute(_SCORES_BY_RISK_QUERIES[after is not None], params, prepare=True)
+        return [RiskScore(*row) for row in cur.fetchall()]
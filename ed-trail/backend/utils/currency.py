@@ -5,10 +5,51 @@ INR handling per ed-trail/prd.md Section 3.
 Rupees → Paise conversion in ED-TRAIL only.
 """
 
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import List, Optional, Sequence, Union
 
-def rupees_to_paise(rupees: float) -> int:
-    """Convert rupees to paise (×100)."""
-    return int(round(rupees * 100))
+_PAISA = Decimal('0.01')
+
+# Below 2**43 paise a float product is off by under 0.002 paise, so an
+# integral rupees * 100 is the exact decimal result, not a rounded one
+_EXACT_FLOAT_PAISE = 2 ** 43
+
+
+def rupees_to_paise(rupees: Union[int, float, str, Decimal]) -> int:
+    """
+    Convert rupees to paise (×100) without binary floating point.
+    
+    WHY Decimal: 12.345 * 100 is 1234.4999... as a float, so the old
+    int(round(rupees * 100)) could drop a paisa. Floats are read through
+    str(), the shortest decimal that round-trips, i.e. the amount as the
+    client sent it. Half a paisa rounds up.
+    WHY int fast path: Whole-rupee amounts need no rounding at all.
+    WHY float fast path: Amounts that already land on a whole paisa
+    (1234.5, 12.34) skip the str/Decimal round trip. Anything else,
+    including every half-paisa case, still goes through Decimal.
+    """
+    if isinstance(rupees, int):
+        return rupees * 100
+    if isinstance(rupees, float):
+        paise = rupees * 100
+        if paise.is_integer() and abs(paise) < _EXACT_FLOAT_PAISE:
+            return int(paise)
+    amount = Decimal(str(rupees)).quantize(_PAISA, rounding=ROUND_HALF_UP)
+    return int(amount.scaleb(2))
+
+
+def rupees_to_paise_many(
+    amounts: Sequence[Optional[Union[int, float, str, Decimal]]]
+) -> List[Optional[int]]:
+    """
+    Convert a batch of rupee amounts to paise. None entries stay None.
+    
+    WHY no NumPy: Float64 arrays cannot reproduce rupees_to_paise's exact
+    decimal rounding, and bulk rows must store what single calls would.
+    """
+    return [rupees_to_paise(amount) if amount is not None else None for amount in amounts]
 
 
 def paise_to_rupees(paise: int) -> float:
@@ -16,10 +57,28 @@ def paise_to_rupees(paise: int) -> float:
     return paise / 100.0
 
 
+# Inserts a comma before every pair of digits that ends the string
+_LAKH_GROUPS = re.compile(r'(\d)(?=(\d\d)+$)')
+
+
+@lru_cache(maxsize=4096)
 def format_inr(paise: int) -> str:
-    """Format paise as INR display string."""
-    rupees = paise_to_rupees(paise)
-    return f"₹{rupees:,.2f}"
+    """
+    Format paise as INR display string, e.g. ₹12,34,567.89.
+    
+    WHY lakh/crore grouping: INR groups the last three digits, then
+    pairs (12,34,567), not the thousands grouping of :,.2f.
+    WHY integer divmod: No float conversion, so large amounts display
+    exactly.
+    WHY cached: List endpoints format one amount per row and impact
+    amounts cluster on round values, so most calls are repeats.
+    """
+    sign = '-' if paise < 0 else ''
+    rupees, paisa = divmod(abs(paise), 100)
+    digits = str(rupees)
+    if len(digits) > 3:
+        digits = _LAKH_GROUPS.sub(r'\1,', digits[:-3]) + ',' + digits[-3:]
+    return f"{sign}₹{digits}.{paisa:02d}"
 
 
 def validate_amount_rupees(rupees: float) -> bool:
@@ -0,0 +1,26 @@
+"""
+ED-TRAIL Serialization Utilities
+JSON encoding for JSONB columns.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj: Any) -> str:
+    """
+    Encode a value for a JSONB parameter.
+    
+    WHY orjson: C encoder, several times faster than json.dumps on the
+    write paths that store details/rule payloads per row. JSONB
+    normalizes whitespace and key order, so stored values match the
+    stdlib fallback.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
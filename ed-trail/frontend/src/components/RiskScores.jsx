@@ -8,7 +8,9 @@ import { formatScore } from '../utils/currency';
 
 export function RiskScoresList({ teamId }) {
     const [scores, setScores] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [minScore, setMinScore] = useState(50);
 
     useEffect(() => {
@@ -16,16 +18,30 @@ export function RiskScoresList({ teamId }) {
 
         setLoading(true);
         fetchHighRiskAssets(teamId, minScore)
-            .then(setScores)
+            .then(page => {
+                setScores(page.scores);
+                setNextCursor(page.next_cursor);
+            })
             .catch(console.error)
             .finally(() => setLoading(false));
     }, [teamId, minScore]);
 
+    const loadMore = () => {
+        setLoadingMore(true);
+        fetchHighRiskAssets(teamId, minScore, nextCursor)
+            .then(page => {
+                setScores(prev => [...prev, ...page.scores]);
+                setNextCursor(page.next_cursor);
+            })
+            .catch(console.error)
+            .finally(() => setLoadingMore(false));
+    };
+
     if (loading) return <div className="card">Loading risk scores...</div>;
 
     return (
         <div className="card">
-            <h2>High Risk Assets ({scores.length})</h2>
+            <h2>High Risk Assets ({scores.length}{nextCursor ? '+' : ''})</h2>
 
             <div style={{ marginBottom: '1rem' }}>
                 <label style={{ marginRight: '0.5rem' }}>Min Score:</label>
@@ -73,6 +89,24 @@ export function RiskScoresList({ teamId }) {
                     </tbody>
                 </table>
             )}
+
+            {nextCursor && (
+                <button
+                    onClick={loadMore}
+                    disabled={loadingMore}
+                    style={{
+                        marginTop: '1rem',
+                        padding: '0.5rem 1rem',
+                        background: 'var(--color-surface)',
+                        border: '1px solid var(--color-border)',
+                        borderRadius: '4px',
+                        color: 'var(--color-text)',
+                        cursor: 'pointer',
+                    }}
+                >
+                    {loadingMore ? 'Loading...' : 'Load more'}
+                </button>
+            )}
         </div>
     );
 }
@@ -51,6 +51,10 @@ export async function fetchAssetScore(teamId, assetId) {
     return fetchApi(`${API_BASE}/assets/${assetId}/score?team_id=${teamId}`);
 }
 
-export async function fetchHighRiskAssets(teamId, minScore = 50) {
-    return fetchApi(`${API_BASE}/scores/high-risk?team_id=${teamId}&min_score=${minScore}`);
+// Returns one page: { scores, next_cursor }. Pass next_cursor back to
+// get the following page; it is null on the last page.
+export async function fetchHighRiskAssets(teamId, minScore = 50, cursor = null) {
+    let url = `${API_BASE}/scores/high-risk?team_id=${teamId}&min_score=${minScore}`;
+    if (cursor) url += `&cursor=${encodeURIComponent(cursor)}`;
+    return fetchApi(url);
 }
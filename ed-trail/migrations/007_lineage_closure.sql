@@ -0,0 +1,139 @@
+-- ED-TRAIL Migration 007: Lineage Closure
+-- Transitive closure of active lineage edges, maintained by trigger
+
+-- WHY closure table: would_create_cycle ran a recursive CTE (up to 100
+-- hops) on every edge insert. With every (ancestor, descendant) pair
+-- stored, the cycle check is a single primary-key probe.
+
+-- WHY table + trigger over materialized view: REFRESH recomputes the
+-- whole graph for every team on every insert. Adding an edge only adds
+-- pairs, so inserts are maintained incrementally.
+
+CREATE TABLE IF NOT EXISTS ed_trail_lineage_closure (
+    team_id UUID NOT NULL REFERENCES teams(id),
+    ancestor_id UUID NOT NULL REFERENCES ed_trail_data_assets(id),
+    descendant_id UUID NOT NULL REFERENCES ed_trail_data_assets(id),
+
+    PRIMARY KEY (team_id, ancestor_id, descendant_id)
+);
+
+-- WHY this index: Trigger looks up all ancestors of an edge's source
+CREATE INDEX IF NOT EXISTS idx_ed_trail_closure_descendant
+    ON ed_trail_lineage_closure(team_id, descendant_id);
+
+-- Serializes closure maintenance per team until commit.
+-- WHY: The trigger computes new pairs from its statement snapshot. Two
+-- concurrent inserts (7->8 and 8->9) would each miss the other's
+-- uncommitted edge, so 7->9 is never stored and a later 9->7 passes the
+-- cycle check. With the lock, each trigger runs after the previous
+-- writer's edges and pairs are visible.
+-- WHY advisory lock over LOCK TABLE: Teams do not block each other, and
+-- readers of ed_trail_lineage_closure are never blocked.
+-- WHY callable from the services: create_lineage_edge and
+-- create_lineage_edges_bulk take it before their cycle check, so the
+-- check and the insert see one consistent graph. They run at READ
+-- COMMITTED so statements after the lock see what it waited for.
+CREATE OR REPLACE FUNCTION ed_trail_lock_lineage(p_team_id UUID)
+RETURNS VOID AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended(p_team_id::TEXT, 0));
+END;
+$$ LANGUAGE plpgsql;
+
+-- Full recompute for one team. Used for backfill and when edges are
+-- deactivated or deleted, since removing a pair needs to know whether
+-- another path still connects it.
+CREATE OR REPLACE FUNCTION ed_trail_rebuild_lineage_closure(p_team_id UUID)
+RETURNS VOID AS $$
+BEGIN
+    PERFORM ed_trail_lock_lineage(p_team_id);
+
+    DELETE FROM ed_trail_lineage_closure WHERE team_id = p_team_id;
+
+    -- WHY UNION: Deduplicates pairs and guarantees termination
+    INSERT INTO ed_trail_lineage_closure (team_id, ancestor_id, descendant_id)
+    WITH RECURSIVE closure(ancestor_id, descendant_id) AS (
+        SELECT source_asset_id, target_asset_id
+        FROM ed_trail_lineage_edges
+        WHERE team_id = p_team_id AND is_active = true
+
+        UNION
+
+        SELECT c.ancestor_id, e.target_asset_id
+        FROM closure c
+        JOIN ed_trail_lineage_edges e ON e.source_asset_id = c.descendant_id
+        WHERE e.team_id = p_team_id AND e.is_active = true
+    )
+    SELECT p_team_id, ancestor_id, descendant_id FROM closure;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION ed_trail_maintain_lineage_closure()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM ed_trail_rebuild_lineage_closure(OLD.team_id);
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND (
+        OLD.is_active
+        OR OLD.team_id IS DISTINCT FROM NEW.team_id
+        OR OLD.source_asset_id IS DISTINCT FROM NEW.source_asset_id
+        OR OLD.target_asset_id IS DISTINCT FROM NEW.target_asset_id
+    ) THEN
+        PERFORM ed_trail_rebuild_lineage_closure(OLD.team_id);
+        IF NEW.team_id IS DISTINCT FROM OLD.team_id THEN
+            PERFORM ed_trail_rebuild_lineage_closure(NEW.team_id);
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    -- Insert, or reactivation: every ancestor of source (and source)
+    -- now reaches every descendant of target (and target)
+    IF NEW.is_active THEN
+        -- WHY before the INSERT below: At READ COMMITTED that statement
+        -- takes its snapshot after the lock, so it sees the pairs of any
+        -- writer that held the lock before us
+        PERFORM ed_trail_lock_lineage(NEW.team_id);
+
+        INSERT INTO ed_trail_lineage_closure (team_id, ancestor_id, descendant_id)
+        SELECT NEW.team_id, a.ancestor_id, d.descendant_id
+        FROM (
+            SELECT NEW.source_asset_id AS ancestor_id
+            UNION
+            SELECT ancestor_id FROM ed_trail_lineage_closure
+            WHERE team_id = NEW.team_id AND descendant_id = NEW.source_asset_id
+        ) a
+        CROSS JOIN (
+            SELECT NEW.target_asset_id AS descendant_id
+            UNION
+            SELECT descendant_id FROM ed_trail_lineage_closure
+            WHERE team_id = NEW.team_id AND ancestor_id = NEW.target_asset_id
+        ) d
+        ON CONFLICT DO NOTHING;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS ed_trail_edges_closure ON ed_trail_lineage_edges;
+CREATE TRIGGER ed_trail_edges_closure
+    AFTER INSERT OR DELETE OR UPDATE OF is_active, team_id, source_asset_id, target_asset_id
+    ON ed_trail_lineage_edges
+    FOR EACH ROW
+    EXECUTE FUNCTION ed_trail_maintain_lineage_closure();
+
+-- Backfill existing graphs
+SELECT ed_trail_rebuild_lineage_closure(team_id)
+FROM (SELECT DISTINCT team_id FROM ed_trail_lineage_edges) t;
+
+-- RLS Policy
+-- WHY select only: Rows are written by the SECURITY DEFINER trigger
+ALTER TABLE ed_trail_lineage_closure ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY ed_trail_closure_select ON ed_trail_lineage_closure
+    FOR SELECT USING (
+        team_id IN (SELECT team_id FROM team_memberships WHERE user_id = auth.uid() AND is_active = true)
+    );
@@ -0,0 +1,47 @@
+-- ED-TRAIL Migration 008: List Indexes
+-- Composite indexes matching the WHERE + ORDER BY of each list query
+
+-- WHY (team_id, sort key DESC): The list functions filter by team and
+-- sort newest first. The single-column team_id indexes from 001-005
+-- return every team row for a top-N sort; these return rows already in
+-- order, so LIMIT and streamed reads stop early.
+
+-- WHY no INCLUDE for index-only scans: Every list query selects the
+-- full dataclass column list (_BREAK_COLUMNS etc.), including JSONB and
+-- TEXT columns. Covering all of them would copy most of the heap into
+-- the index, and anything less still needs the heap fetch.
+
+-- WHY CONCURRENTLY: Builds without blocking writes to live tables.
+-- Must run outside a transaction block, one statement at a time.
+
+-- list_break_events: team_id [+ status/severity] ORDER BY detected_at DESC
+-- WHY not partial on status: The unfiltered list is the common call and
+-- must include resolved events.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_breaks_team_detected
+    ON ed_trail_break_events(team_id, detected_at DESC);
+
+-- list_data_sources: team_id [+ is_active] ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_sources_team_created
+    ON ed_trail_data_sources(team_id, created_at DESC);
+
+-- list_data_assets: team_id AND is_active ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_assets_team_created
+    ON ed_trail_data_assets(team_id, created_at DESC) WHERE is_active = true;
+
+-- list_checks: team_id AND is_active ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_checks_team_created
+    ON ed_trail_integrity_checks(team_id, created_at DESC) WHERE is_active = true;
+
+-- get_asset_lineage upstream / downstream
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_edges_team_target
+    ON ed_trail_lineage_edges(team_id, target_asset_id) WHERE is_active = true;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_edges_team_source
+    ON ed_trail_lineage_edges(team_id, source_asset_id) WHERE is_active = true;
+
+-- WHY ANALYZE: Fresh statistics so the planner picks the new indexes
+ANALYZE ed_trail_break_events;
+ANALYZE ed_trail_data_sources;
+ANALYZE ed_trail_data_assets;
+ANALYZE ed_trail_integrity_checks;
+ANALYZE ed_trail_lineage_edges;
@@ -0,0 +1,116 @@
+-- ED-TRAIL Migration 009: Break Events Partitioning
+-- Hash partitions on team_id so each team's breaks live in one partition
+
+-- WHY partition: Break events only grow (resolution updates in place).
+-- Every query filters by team_id, so the planner prunes to a single
+-- partition and scans its smaller indexes instead of table-wide ones.
+
+-- WHY HASH (team_id) over RANGE (detected_at): Listing is not time
+-- bounded, so range pruning would still touch every month. Hash
+-- partitions also need no maintenance job or default partition.
+
+-- WHY only break events: ed_trail_integrity_checks is referenced by
+-- foreign keys on id alone, and a partitioned table's primary key must
+-- include the partition key.
+
+BEGIN;
+
+ALTER TABLE ed_trail_break_events RENAME TO ed_trail_break_events_legacy;
+
+DROP INDEX IF EXISTS idx_ed_trail_breaks_team;
+DROP INDEX IF EXISTS idx_ed_trail_breaks_check;
+DROP INDEX IF EXISTS idx_ed_trail_breaks_asset;
+DROP INDEX IF EXISTS idx_ed_trail_breaks_status;
+DROP INDEX IF EXISTS idx_ed_trail_breaks_severity;
+DROP INDEX IF EXISTS idx_ed_trail_breaks_detected;
+DROP INDEX IF EXISTS idx_ed_trail_breaks_team_detected;
+
+CREATE TABLE ed_trail_break_events (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+
+    -- Team isolation
+    team_id UUID NOT NULL REFERENCES teams(id),
+
+    -- Break source
+    check_id UUID REFERENCES ed_trail_integrity_checks(id),
+    asset_id UUID REFERENCES ed_trail_data_assets(id),
+    edge_id UUID REFERENCES ed_trail_lineage_edges(id),
+
+    -- Break details
+    break_type VARCHAR(50) NOT NULL, -- 'missing_source', 'data_mismatch', 'late_arrival', 'orphaned_asset', 'cycle_detected'
+    severity VARCHAR(20) NOT NULL DEFAULT 'medium', -- 'low', 'medium', 'high', 'critical'
+
+    -- Description
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    details JSONB,
+
+    -- Financial impact (stored in paise for INR)
+    impact_amount_paise BIGINT,
+    currency VARCHAR(3) DEFAULT 'INR',
+
+    -- Resolution
+    status VARCHAR(20) NOT NULL DEFAULT 'open', -- 'open', 'investigating', 'resolved', 'dismissed'
+    resolved_at TIMESTAMPTZ,
+    resolved_by UUID REFERENCES auth.users(id),
+    resolution_notes TEXT,
+
+    -- Timing
+    detected_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    -- Audit fields
+    created_by UUID NOT NULL REFERENCES auth.users(id),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    -- WHY team_id in key: PostgreSQL requires the partition key in every
+    -- unique constraint on a partitioned table. ids are random UUIDs.
+    PRIMARY KEY (id, team_id)
+) PARTITION BY HASH (team_id);
+
+DO $$
+BEGIN
+    FOR i IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF ed_trail_break_events FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            'ed_trail_break_events_p' || lpad(i::TEXT, 2, '0'), i
+        );
+    END LOOP;
+END $$;
+
+INSERT INTO ed_trail_break_events
+SELECT * FROM ed_trail_break_events_legacy;
+
+DROP TABLE ed_trail_break_events_legacy;
+
+-- Partitioned indexes, one btree per partition.
+-- (team_id, detected_at DESC) also covers plain team_id lookups.
+CREATE INDEX IF NOT EXISTS idx_ed_trail_breaks_team_detected
+    ON ed_trail_break_events(team_id, detected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ed_trail_breaks_check ON ed_trail_break_events(check_id);
+CREATE INDEX IF NOT EXISTS idx_ed_trail_breaks_asset ON ed_trail_break_events(asset_id);
+CREATE INDEX IF NOT EXISTS idx_ed_trail_breaks_status ON ed_trail_break_events(status);
+CREATE INDEX IF NOT EXISTS idx_ed_trail_breaks_severity ON ed_trail_break_events(severity);
+CREATE INDEX IF NOT EXISTS idx_ed_trail_breaks_detected ON ed_trail_break_events(detected_at);
+
+-- RLS carried over from migration 005
+ALTER TABLE ed_trail_break_events ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY ed_trail_breaks_select ON ed_trail_break_events
+    FOR SELECT USING (
+        team_id IN (SELECT team_id FROM team_memberships WHERE user_id = auth.uid() AND is_active = true)
+    );
+
+CREATE POLICY ed_trail_breaks_insert ON ed_trail_break_events
+    FOR INSERT WITH CHECK (
+        team_id IN (SELECT team_id FROM team_memberships WHERE user_id = auth.uid() AND is_active = true)
+    );
+
+CREATE POLICY ed_trail_breaks_update ON ed_trail_break_events
+    FOR UPDATE USING (
+        team_id IN (SELECT team_id FROM team_memberships WHERE user_id = auth.uid() AND is_active = true AND role IN ('owner', 'admin'))
+    );
+
+COMMIT;
+
+ANALYZE ed_trail_break_events;
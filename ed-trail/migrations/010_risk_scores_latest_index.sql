@@ -0,0 +1,19 @@
+-- ED-TRAIL Migration 010: Risk Scores Latest Index
+-- Team-scoped index matching "latest score per asset" reads
+
+-- WHY (team_id, asset_id, computed_at DESC): list_scores_by_risk runs
+-- DISTINCT ON (asset_id) ... ORDER BY asset_id, computed_at DESC within
+-- one team, and get_latest_score reads one asset's newest row. Both walk
+-- this index in order with no sort step. idx_ed_trail_scores_latest
+-- (006) lacks the team_id prefix.
+
+-- WHY no INCLUDE: Both queries return score_factors (JSONB). Covering
+-- it would duplicate most of each row in the index, and without it an
+-- index-only scan is impossible anyway.
+
+-- WHY CONCURRENTLY: Builds without blocking score inserts.
+-- Must run outside a transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ed_trail_scores_team_asset_computed
+    ON ed_trail_risk_scores(team_id, asset_id, computed_at DESC);
+
+ANALYZE ed_trail_risk_scores;
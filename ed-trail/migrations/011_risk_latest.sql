@@ -0,0 +1,72 @@
+-- ED-TRAIL Migration 011: Latest Risk Score per Asset
+-- One row per (team, asset) pointing at its newest score, maintained by trigger
+
+-- WHY: list_scores_by_risk ran DISTINCT ON over every score ever stored
+-- for the team, so its cost grew with history. This table has one row
+-- per asset, indexed by score, so the list is a range scan plus LIMIT.
+
+-- WHY table + trigger over materialized view: REFRESH ... CONCURRENTLY
+-- recomputes every team's latest rows and diffs them on each refresh.
+-- A new score replaces exactly one row, so it is upserted in place and
+-- is visible as soon as its transaction commits.
+
+-- WHY insert-only trigger: ed_trail_risk_scores is append-only (006
+-- grants no UPDATE or DELETE policy).
+
+CREATE TABLE IF NOT EXISTS ed_trail_risk_latest (
+    team_id UUID NOT NULL REFERENCES teams(id),
+    asset_id UUID NOT NULL REFERENCES ed_trail_data_assets(id),
+    score_id UUID NOT NULL REFERENCES ed_trail_risk_scores(id),
+    overall_score INTEGER NOT NULL,
+    computed_at TIMESTAMPTZ NOT NULL,
+
+    PRIMARY KEY (team_id, asset_id)
+);
+
+-- WHY this index: list_scores_by_risk filters by team and minimum score,
+-- returns highest first, and pages with a keyset cursor,
+-- (overall_score, asset_id) < (last score, last asset). asset_id breaks
+-- score ties, so the next page is a seek in index order with no sort
+-- and no OFFSET scan.
+CREATE INDEX IF NOT EXISTS idx_ed_trail_risk_latest_team_score_asset
+    ON ed_trail_risk_latest(team_id, overall_score DESC, asset_id DESC);
+
+CREATE OR REPLACE FUNCTION ed_trail_maintain_risk_latest()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO ed_trail_risk_latest (team_id, asset_id, score_id, overall_score, computed_at)
+    VALUES (NEW.team_id, NEW.asset_id, NEW.id, NEW.overall_score, NEW.computed_at)
+    ON CONFLICT (team_id, asset_id) DO UPDATE
+    SET score_id = EXCLUDED.score_id,
+        overall_score = EXCLUDED.overall_score,
+        computed_at = EXCLUDED.computed_at
+    -- WHY guard: A score backdated with an older computed_at must not
+    -- replace a newer one
+    WHERE ed_trail_risk_latest.computed_at <= EXCLUDED.computed_at;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS ed_trail_scores_latest ON ed_trail_risk_scores;
+CREATE TRIGGER ed_trail_scores_latest
+    AFTER INSERT ON ed_trail_risk_scores
+    FOR EACH ROW
+    EXECUTE FUNCTION ed_trail_maintain_risk_latest();
+
+-- Backfill from existing history
+INSERT INTO ed_trail_risk_latest (team_id, asset_id, score_id, overall_score, computed_at)
+SELECT DISTINCT ON (team_id, asset_id)
+    team_id, asset_id, id, overall_score, computed_at
+FROM ed_trail_risk_scores
+ORDER BY team_id, asset_id, computed_at DESC
+ON CONFLICT (team_id, asset_id) DO NOTHING;
+
+-- RLS Policy
+-- WHY select only: Rows are written by the SECURITY DEFINER trigger
+ALTER TABLE ed_trail_risk_latest ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY ed_trail_risk_latest_select ON ed_trail_risk_latest
+    FOR SELECT USING (
+        team_id IN (SELECT team_id FROM team_memberships WHERE user_id = auth.uid() AND is_active = true)
+    );
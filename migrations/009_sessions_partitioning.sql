@@ -0,0 +1,141 @@
+-- ED-BASE Migration 009: Sessions Partitioning
+-- Purpose: Monthly range partitions on sessions.created_at
+-- Retention becomes DROP TABLE on old partitions instead of row DELETEs
+
+-- WHY partition: cleanup_expired_sessions used to DELETE revoked rows,
+-- which scans the table, writes WAL per row and leaves dead tuples for
+-- VACUUM. Dropping a whole month is a metadata-only operation.
+
+-- WHY created_at as partition key: It is immutable once written, so rows
+-- never move between partitions. revoked_at is updated in place.
+
+-- WHY safe to drop unrevoked rows too: Access tokens live 15 minutes
+-- (PRD §6). A session row older than the retention window can no longer
+-- authenticate, and missing sessions are rejected (Invariant #1).
+
+-- WHY no default partition: Once rows for a month landed in a default
+-- partition, creating that month's partition would fail. PostgreSQL
+-- also refuses DETACH PARTITION ... CONCURRENTLY while one exists.
+-- Partitions are created ahead instead (ensure_session_partitions at
+-- startup and in cleanup_expired_sessions), and create_session creates
+-- a missing month before retrying.
+
+BEGIN;
+
+ALTER TABLE sessions RENAME TO sessions_legacy;
+
+DROP INDEX IF EXISTS idx_sessions_token_hash;
+DROP INDEX IF EXISTS idx_sessions_user_id;
+DROP INDEX IF EXISTS idx_sessions_revoked_at;
+DROP INDEX IF EXISTS idx_sessions_team_id;
+
+CREATE TABLE sessions (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+
+    -- Links session to Supabase Auth user
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+
+    -- SHA-256 hash of the JWT access token
+    token_hash VARCHAR(64) NOT NULL,
+
+    team_id UUID,
+
+    -- Session metadata for audit trail
+    ip_address INET,
+    user_agent TEXT,
+
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_used_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    -- NULL means session is valid, non-NULL means revoked
+    revoked_at TIMESTAMPTZ,
+    revocation_reason VARCHAR(50),
+
+    -- WHY created_at in keys: PostgreSQL requires the partition key in
+    -- every unique constraint on a partitioned table
+    PRIMARY KEY (id, created_at),
+    UNIQUE (token_hash, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- WHY function: Partitions must exist before rows arrive. Called here
+-- for the backfill and by ensure_session_partitions to stay ahead.
+-- WHY advisory lock: Every worker ensures partitions at startup.
+-- Concurrent CREATE TABLE IF NOT EXISTS for one name can still fail on
+-- the catalog unique index, so creators take turns.
+CREATE OR REPLACE FUNCTION ensure_sessions_partition(p_month DATE)
+RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::DATE;
+    v_end DATE := (date_trunc('month', p_month) + interval '1 month')::DATE;
+    v_name TEXT := 'sessions_' || to_char(v_start, 'YYYYMM');
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('ensure_sessions_partition'));
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF sessions FOR VALUES FROM (%L) TO (%L)',
+        v_name, v_start, v_end
+    );
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create partitions covering existing data plus the next three months,
+-- matching SESSION_PARTITION_MONTHS_AHEAD
+DO $$
+DECLARE
+    v_month DATE;
+BEGIN
+    FOR v_month IN
+        SELECT generate_series(
+            date_trunc('month', COALESCE((SELECT min(created_at) FROM sessions_legacy), now())),
+            date_trunc('month', now()) + interval '3 months',
+            interval '1 month'
+        )::DATE
+    LOOP
+        PERFORM ensure_sessions_partition(v_month);
+    END LOOP;
+END $$;
+
+INSERT INTO sessions (
+    id, user_id, token_hash, team_id, ip_address, user_agent,
+    created_at, last_used_at, revoked_at, revocation_reason
+)
+SELECT id, user_id, token_hash, team_id, ip_address, user_agent,
+       created_at, last_used_at, revoked_at, revocation_reason
+FROM sessions_legacy;
+
+DROP TABLE sessions_legacy;
+
+-- WHY this index: Every authenticated request checks session validity
+-- by token hash. Partitioned index, one btree per month.
+CREATE INDEX IF NOT EXISTS idx_sessions_token_hash ON sessions(token_hash);
+
+-- WHY this index: Finding all sessions for a user during forced logout
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
+
+-- WHY this index: Team-based session queries for admin operations
+CREATE INDEX IF NOT EXISTS idx_sessions_team_id ON sessions(team_id);
+
+-- RLS carried over from migration 008
+ALTER TABLE sessions ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS sessions_select_policy ON sessions;
+CREATE POLICY sessions_select_policy ON sessions
+    FOR SELECT
+    USING (user_id = auth.uid());
+
+DROP POLICY IF EXISTS sessions_insert_policy ON sessions;
+CREATE POLICY sessions_insert_policy ON sessions
+    FOR INSERT
+    WITH CHECK (user_id = auth.uid());
+
+DROP POLICY IF EXISTS sessions_update_policy ON sessions;
+CREATE POLICY sessions_update_policy ON sessions
+    FOR UPDATE
+    USING (user_id = auth.uid());
+
+COMMENT ON TABLE sessions IS 'Session revocation table, partitioned monthly by created_at. Check this table on EVERY request.';
+COMMENT ON COLUMN sessions.token_hash IS 'SHA-256 hash of JWT access token. Never store raw tokens.';
+COMMENT ON COLUMN sessions.revoked_at IS 'NULL = valid session. Non-NULL = revoked. Revoked sessions MUST be rejected.';
+COMMENT ON FUNCTION ensure_sessions_partition(DATE) IS 'Idempotently creates the monthly sessions partition containing p_month.';
+
+COMMIT;